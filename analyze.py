@@ -0,0 +1,782 @@
+#!/usr/bin/env python3
+"""
+Aggregate LLM analysis of downloaded Xiaohongshu content
+Reads the per-post metadata.json files saved by the downloader and produces
+aggregate analysis results (JSON + markdown report) for a keyword folder.
+"""
+
+import os
+import sys
+import heapq
+import asyncio
+import argparse
+from pathlib import Path
+from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Try importing dependencies
+try:
+    import orjson
+    import numpy as np
+    from rich.console import Console
+    from utils.llm_providers import LLMFactory
+    from utils.llm_cache import cached_analyze
+except ImportError:
+    print("Error: Analysis dependencies not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+console = Console()
+
+DOWNLOADED_ROOT = Path("data/downloaded_content")
+POST_SEPARATOR = "\n\n---POST SEPARATOR---\n\n"
+PROMPT_HEADER = "You are analyzing aggregated Xiaohongshu (RED) posts.\n\nPosts:\n"
+# Rough ceiling for a merged multi-type prompt before falling back to
+# one call per type (stays well inside current model context windows)
+MAX_BATCH_PROMPT_CHARS = 80000
+
+
+@lru_cache(maxsize=1)
+def load_analysis_config() -> Dict[str, Any]:
+    """Load analysis types and presets from config.yaml (parsed once).
+
+    Uses the libyaml CSafeLoader when the binding is available; the pure
+    Python SafeLoader is noticeably slower.
+    """
+    import yaml
+
+    config_path = Path(__file__).parent / "config.yaml"
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(config_path.read_text(encoding="utf-8"), Loader=loader)
+
+
+@dataclass
+class PostRecord:
+    """The slice of a post's metadata the aggregate analysis actually uses"""
+    post_id: str
+    title: str
+    description: str
+    likes: int
+    comments: int
+    shares: int
+    author_name: str
+
+
+def _as_int(value: Any) -> int:
+    """Coerce engagement counts that may be strings like '1,024'"""
+    if isinstance(value, str):
+        value = value.replace(",", "")
+        return int(value) if value.isdigit() else 0
+    return int(value or 0)
+
+
+def _extract_fields(raw_bytes: bytes) -> PostRecord:
+    """Parse metadata.json bytes, keeping only the fields analysis reads.
+
+    Counts are coerced once here so downstream consumers never re-check
+    types; the rest of the (large) post dict is dropped immediately.
+    """
+    post = orjson.loads(raw_bytes)
+    text_content = post.get("text_content", {})
+    engagement = post.get("engagement", {})
+    return PostRecord(
+        post_id=post.get("post_id", "unknown"),
+        title=text_content.get("title", ""),
+        description=text_content.get("description", ""),
+        likes=_as_int(engagement.get("likes")),
+        comments=_as_int(engagement.get("comments")),
+        shares=_as_int(engagement.get("shares")),
+        author_name=post.get("author", {}).get("name", "Unknown"),
+    )
+
+
+def _load_one(post_dir: Path) -> Optional[Tuple[PostRecord, List[Path]]]:
+    """Load a single post's metadata and image paths (thread-pool worker).
+
+    One scandir pass picks up metadata.json and the image files together,
+    instead of a glob walk plus a separate existence probe.
+    """
+    image_files: List[Path] = []
+    has_metadata = False
+    with os.scandir(post_dir) as it:
+        for entry in it:
+            if entry.name == "metadata.json":
+                has_metadata = True
+            elif entry.name.startswith("image_"):
+                image_files.append(Path(entry.path))
+    if not has_metadata:
+        return None
+    image_files.sort()
+    return _extract_fields((post_dir / "metadata.json").read_bytes()), image_files
+
+
+INDEX_FILENAME = ".posts_index.json"
+
+
+def _load_index(index_path: Path, max_mtime: float):
+    """Load the cached posts index if it is newer than every post's metadata"""
+    try:
+        if index_path.stat().st_mtime < max_mtime:
+            return None
+        cached = orjson.loads(index_path.read_bytes())
+        return (
+            cached["texts"],
+            [PostRecord(**record) for record in cached["records"]],
+            [Path(p) for p in cached["images"]],
+        )
+    except (FileNotFoundError, KeyError, TypeError, orjson.JSONDecodeError):
+        return None
+
+
+def collect_all_content(keyword_path: Path) -> Tuple[List[str], List[PostRecord], List[Path]]:
+    """Collect post texts, metadata and image paths from a keyword folder.
+
+    Loading is I/O-bound (one small JSON per post), so reads go through a
+    thread pool and the OS can overlap and reorder them. A parsed index is
+    cached next to the posts and reused until any post folder or its
+    metadata.json changes, so repeat analyses skip re-parsing every file.
+    """
+    # One scandir pass gathers the post dirs and their mtimes together.
+    # Rewriting metadata.json in place (a same-day re-scrape) does not
+    # touch the folder mtime, so the metadata files are statted too; the
+    # keyword folder's own mtime catches post folders being deleted.
+    post_dirs: List[Path] = []
+    max_mtime = keyword_path.stat().st_mtime
+    with os.scandir(keyword_path) as it:
+        for entry in it:
+            if not entry.is_dir(follow_symlinks=False) or entry.name.startswith("."):
+                continue
+            post_dirs.append(Path(entry.path))
+            mtime = entry.stat(follow_symlinks=False).st_mtime
+            if mtime > max_mtime:
+                max_mtime = mtime
+    post_dirs.sort()
+
+    for post_dir in post_dirs:
+        try:
+            mtime = (post_dir / "metadata.json").stat().st_mtime
+        except FileNotFoundError:
+            continue
+        if mtime > max_mtime:
+            max_mtime = mtime
+
+    index_path = keyword_path / INDEX_FILENAME
+    cached = _load_index(index_path, max_mtime)
+    if cached is not None:
+        return cached
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        loaded = list(executor.map(_load_one, post_dirs))
+
+    all_texts: List[str] = []
+    all_metadata: List[PostRecord] = []
+    all_images: List[Path] = []
+
+    for item in loaded:
+        if item is None:
+            continue
+        record, image_files = item
+
+        combined = "\n".join(
+            part for part in (record.title, record.description) if part
+        )
+        if combined:
+            all_texts.append(combined)
+
+        all_metadata.append(record)
+        all_images.extend(image_files)
+
+    index_path.write_bytes(
+        orjson.dumps({
+            "texts": all_texts,
+            "records": [asdict(record) for record in all_metadata],
+            "images": [str(p) for p in all_images],
+        })
+    )
+
+    return all_texts, all_metadata, all_images
+
+
+def calculate_statistics(all_metadata: List[PostRecord]) -> Dict[str, Any]:
+    """Aggregate engagement statistics across posts"""
+    count = len(all_metadata)
+    if count == 0:
+        return {
+            "post_count": 0,
+            "total_likes": 0,
+            "total_comments": 0,
+            "total_shares": 0,
+            "top_posts_by_likes": [],
+            "top_authors": [],
+        }
+
+    likes = np.fromiter((r.likes for r in all_metadata), dtype=np.int64, count=count)
+    comments = np.fromiter((r.comments for r in all_metadata), dtype=np.int64, count=count)
+    shares = np.fromiter((r.shares for r in all_metadata), dtype=np.int64, count=count)
+
+    # Top-k via argpartition keeps this O(N) instead of sorting all posts
+    k = min(5, count)
+    top_idx = np.argpartition(-likes, k - 1)[:k]
+    top_idx = top_idx[np.argsort(-likes[top_idx])]
+    top_by_likes = [all_metadata[i] for i in top_idx]
+
+    author_counts = Counter(record.author_name for record in all_metadata)
+    # O(N log 5) selection instead of sorting the whole counter
+    top_authors = heapq.nlargest(5, author_counts.items(), key=itemgetter(1))
+
+    return {
+        "post_count": count,
+        "total_likes": int(likes.sum()),
+        "total_comments": int(comments.sum()),
+        "total_shares": int(shares.sum()),
+        "top_posts_by_likes": [
+            {"post_id": r.post_id, "title": r.title, "likes": r.likes}
+            for r in top_by_likes
+        ],
+        "top_authors": top_authors,
+    }
+
+
+def deduplicate_texts(all_texts: List[str]) -> Tuple[List[str], float]:
+    """Drop duplicate and near-duplicate posts before building the corpus.
+
+    Reposts and copy-paste duplicates otherwise burn token budget on
+    redundant content. Exact duplicates are removed first; when datasketch
+    is installed, a MinHash LSH over 5-token shingles also drops texts that
+    are ~85% similar to one already kept. Returns the kept texts and the
+    fraction removed.
+    """
+    if not all_texts:
+        return all_texts, 0.0
+
+    unique = list(dict.fromkeys(all_texts))
+
+    try:
+        from datasketch import MinHash, MinHashLSH
+    except ImportError:
+        kept = unique
+    else:
+        lsh = MinHashLSH(threshold=0.85, num_perm=64)
+        kept = []
+        for idx, text in enumerate(unique):
+            tokens = text.split()
+            shingles = {" ".join(tokens[i:i + 5]) for i in range(max(1, len(tokens) - 4))}
+            minhash = MinHash(num_perm=64)
+            for shingle in shingles:
+                minhash.update(shingle.encode("utf-8"))
+            if lsh.query(minhash):
+                continue
+            lsh.insert(str(idx), minhash)
+            kept.append(text)
+
+    return kept, 1.0 - len(kept) / len(all_texts)
+
+
+def _chunk_corpus(all_texts: List[str], max_chars: int = 25000, overlap: int = 1) -> List[str]:
+    """Greedily pack whole posts into corpus chunks under a char budget.
+
+    Posts are never split mid-text; consecutive chunks share `overlap`
+    trailing posts so cross-post signal at the boundary is not lost.
+    """
+    chunks: List[str] = []
+    buf: List[str] = []
+    size = 0
+    for text in all_texts:
+        added = len(text) + len(POST_SEPARATOR)
+        if buf and size + added > max_chars:
+            chunks.append(POST_SEPARATOR.join(buf))
+            buf = buf[-overlap:] if overlap else []
+            size = sum(len(t) + len(POST_SEPARATOR) for t in buf)
+        buf.append(text)
+        size += added
+    if buf:
+        chunks.append(POST_SEPARATOR.join(buf))
+    return chunks
+
+
+def run_analyses_chunked(
+    llm,
+    chunks: List[str],
+    analysis_types: List[str],
+    build_suffix,
+    key_fields: Tuple[str, ...] = (),
+    use_cache: bool = True,
+    max_concurrent: int = 5,
+) -> List[Tuple[str, Any]]:
+    """Map-reduce analysis for corpora that span several chunks.
+
+    Each (type, chunk) pair is analyzed concurrently, then a reduce call
+    merges the per-chunk findings for each type. Chunk-level responses go
+    through the LLM cache, so incremental re-runs skip finished chunks.
+    """
+    prefixes = [f"{PROMPT_HEADER}{chunk}" for chunk in chunks]
+    total = len(chunks)
+
+    async def _map_one(semaphore: asyncio.Semaphore, analysis_type: str, idx: int):
+        suffix = build_suffix(analysis_type)
+        if suffix is None:
+            return None
+        async with semaphore:
+            response = await asyncio.to_thread(
+                cached_analyze,
+                llm,
+                prefixes[idx],
+                f"{suffix}\n\nNote: this is corpus chunk {idx + 1} of {total}.",
+                key_fields=key_fields + (analysis_type, f"chunk{idx}"),
+                use_cache=use_cache,
+            )
+        return analysis_type, idx, response
+
+    async def _reduce_one(semaphore: asyncio.Semaphore, analysis_type: str, parts):
+        parts_json = ",\n".join(
+            orjson.dumps(response).decode() for _, response in sorted(parts)
+        )
+        console.print(f"  Reducing [cyan]{analysis_type}[/cyan] across {len(parts)} chunks...")
+        async with semaphore:
+            merged = await asyncio.to_thread(
+                cached_analyze,
+                llm,
+                f"You previously produced these per-chunk analyses:\n[{parts_json}]",
+                "Merge the chunk analyses above into a single aggregate analysis "
+                "with the same JSON structure, preserving frequencies and themes.",
+                key_fields=key_fields + (analysis_type, "reduce"),
+                use_cache=use_cache,
+            )
+        return analysis_type, merged
+
+    async def _run_all():
+        semaphore = asyncio.Semaphore(max_concurrent)
+        mapped = await asyncio.gather(
+            *[
+                _map_one(semaphore, analysis_type, idx)
+                for analysis_type in analysis_types
+                for idx in range(total)
+            ]
+        )
+        by_type: Dict[str, List[Tuple[int, Any]]] = {}
+        for item in mapped:
+            if item is not None:
+                by_type.setdefault(item[0], []).append((item[1], item[2]))
+        return await asyncio.gather(
+            *[_reduce_one(semaphore, t, parts) for t, parts in by_type.items()]
+        )
+
+    return list(asyncio.run(_run_all()))
+
+
+def run_analyses_batched(
+    llm,
+    corpus_prefix: str,
+    analysis_types: List[str],
+    config: Dict[str, Any],
+    context_note: str,
+    key_fields: Tuple[str, ...] = (),
+    use_cache: bool = True,
+) -> Optional[List[Tuple[str, Any]]]:
+    """Ask for every analysis type in one structured response.
+
+    Sending the corpus once with a merged instruction block cuts input
+    tokens by roughly the number of types. Returns None when the merged
+    prompt would be too large or the model does not return the expected
+    JSON object, so the caller can fall back to per-type calls.
+    """
+    valid_types: List[str] = []
+    sections: List[str] = []
+    for analysis_type in analysis_types:
+        text_prompt = config["analysis_types"].get(analysis_type, {}).get("text_prompt", "")
+        if not text_prompt:
+            console.print(f"[yellow]Unknown analysis type: {analysis_type}, skipping[/yellow]")
+            continue
+        valid_types.append(analysis_type)
+        sections.append(f"### {analysis_type}\n{text_prompt.strip()}")
+
+    if not valid_types:
+        return []
+
+    merged_suffix = (
+        f"{context_note}\n\n"
+        f"Return one JSON object with exactly these keys: {', '.join(valid_types)}. "
+        "Each key's value must follow the matching instructions below.\n\n"
+        + "\n\n".join(sections)
+    )
+
+    if len(corpus_prefix) + len(merged_suffix) > MAX_BATCH_PROMPT_CHARS:
+        return None
+
+    console.print(f"  Running batched analysis for {len(valid_types)} types...")
+    response = cached_analyze(
+        llm,
+        corpus_prefix,
+        merged_suffix,
+        key_fields=key_fields + ("batch",) + tuple(valid_types),
+        use_cache=use_cache,
+    )
+    if not isinstance(response, dict):
+        console.print("[yellow]Batched response was not JSON; falling back to per-type calls[/yellow]")
+        return None
+    return [(t, response[t]) for t in valid_types if t in response]
+
+
+def run_analyses(
+    llm,
+    corpus_prefix: str,
+    analysis_types: List[str],
+    build_suffix,
+    key_fields: Tuple[str, ...] = (),
+    use_cache: bool = True,
+    max_concurrent: int = 5,
+) -> List[Tuple[str, Any]]:
+    """Dispatch the per-type LLM calls concurrently.
+
+    Each analysis type is independent and network-bound, so wall time drops
+    from the sum of the calls to roughly the slowest one. The providers are
+    synchronous, so calls are pushed onto worker threads via
+    asyncio.to_thread; a semaphore keeps concurrent requests within provider
+    rate limits.
+
+    corpus_prefix is byte-identical across the types so providers with
+    prompt caching only pay for the corpus once; build_suffix returns the
+    type-specific instructions (or None to skip the type).
+    """
+
+    async def _run_one(semaphore: asyncio.Semaphore, analysis_type: str):
+        suffix = build_suffix(analysis_type)
+        if suffix is None:
+            return analysis_type, None
+        async with semaphore:
+            console.print(f"  Running [cyan]{analysis_type}[/cyan] analysis...")
+            response = await asyncio.to_thread(
+                cached_analyze,
+                llm,
+                corpus_prefix,
+                suffix,
+                key_fields=key_fields + (analysis_type,),
+                use_cache=use_cache,
+            )
+        console.print(f"  Finished [cyan]{analysis_type}[/cyan]")
+        return analysis_type, response
+
+    async def _run_all():
+        semaphore = asyncio.Semaphore(max_concurrent)
+        return await asyncio.gather(
+            *[_run_one(semaphore, analysis_type) for analysis_type in analysis_types]
+        )
+
+    return [(t, r) for t, r in asyncio.run(_run_all()) if r is not None]
+
+
+def analyze_aggregated_content(
+    keyword_path: Path,
+    analysis_types: List[str],
+    provider_name: str = "openai",
+    use_cache: bool = True,
+    batch_types: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """Run the requested analysis types over all content in a keyword folder"""
+    config = load_analysis_config()
+    llm = LLMFactory.create_provider(provider_name)
+
+    console.print(f"[bold]Collecting content from {keyword_path}...[/bold]")
+    all_texts, all_metadata, all_images = collect_all_content(keyword_path)
+
+    if not all_texts:
+        console.print("[red]No post text found in this folder.[/red]")
+        return None
+
+    all_texts, dedup_ratio = deduplicate_texts(all_texts)
+    chunks = _chunk_corpus(all_texts)
+    corpus = chunks[0]
+
+    post_count = len(all_metadata)
+    keyword = keyword_path.name
+    console.print(
+        f"  {post_count} posts, {len(all_images)} images, "
+        f"{len(chunks)} corpus chunk{'s' if len(chunks) != 1 else ''} "
+        f"({dedup_ratio:.0%} duplicate text dropped)"
+    )
+
+    results: Dict[str, Any] = {
+        "metadata": {
+            "keyword": keyword,
+            "post_count": post_count,
+            "image_count": len(all_images),
+            "provider": provider_name,
+            "dedup_ratio": round(dedup_ratio, 3),
+            "analyzed_at": datetime.now().isoformat(),
+        },
+        "statistics": calculate_statistics(all_metadata),
+        "analysis": {},
+    }
+
+    # Stable prefix shared by every analysis type; run-specific details live
+    # in the suffix so the prefix stays cache-eligible.
+    corpus_prefix = f"{PROMPT_HEADER}{corpus}"
+
+    # Resolve prompt templates once so the dispatch path only formats strings
+    prompts_by_type: Dict[str, str] = {}
+    for analysis_type in analysis_types:
+        text_prompt = config["analysis_types"].get(analysis_type, {}).get("text_prompt", "")
+        if text_prompt:
+            prompts_by_type[analysis_type] = text_prompt
+        else:
+            console.print(f"[yellow]Unknown analysis type: {analysis_type}, skipping[/yellow]")
+
+    context_note = f"The corpus above contains {post_count} posts about \"{keyword}\"."
+
+    def _build_suffix(analysis_type: str) -> Optional[str]:
+        text_prompt = prompts_by_type.get(analysis_type)
+        if text_prompt is None:
+            return None
+        return f"{context_note}\n\n{text_prompt}"
+
+    analyses = None
+    if batch_types and len(chunks) == 1:
+        analyses = run_analyses_batched(
+            llm,
+            corpus_prefix,
+            analysis_types,
+            config,
+            f"The corpus above contains {post_count} posts about \"{keyword}\".",
+            key_fields=(provider_name,),
+            use_cache=use_cache,
+        )
+    if analyses is not None:
+        pass
+    elif len(chunks) > 1:
+        analyses = run_analyses_chunked(
+            llm,
+            chunks,
+            analysis_types,
+            _build_suffix,
+            key_fields=(provider_name,),
+            use_cache=use_cache,
+            max_concurrent=config.get("max_concurrent_llm", 5),
+        )
+    else:
+        analyses = run_analyses(
+            llm,
+            corpus_prefix,
+            analysis_types,
+            _build_suffix,
+            key_fields=(provider_name,),
+            use_cache=use_cache,
+            max_concurrent=config.get("max_concurrent_llm", 5),
+        )
+
+    for analysis_type, response in analyses:
+        results["analysis"][analysis_type] = response
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    save_aggregate_results(results, keyword_path / f"analysis_{timestamp}.json")
+    create_markdown_report(results, keyword_path / f"analysis_report_{timestamp}.md")
+    return results
+
+
+def write_results_file(output_file: Path, results: Dict[str, Any]):
+    """Serialize results with orjson straight onto a file descriptor.
+
+    OPT_SERIALIZE_NUMPY lets any numpy scalars from the statistics pass
+    through without per-value conversion.
+    """
+    payload = orjson.dumps(
+        results,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+    fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def save_aggregate_results(results: Dict[str, Any], output_file: Path):
+    """Save aggregate analysis results to JSON"""
+    write_results_file(output_file, results)
+    console.print(f"[green]Results saved to {output_file}[/green]")
+
+
+@lru_cache(maxsize=256)
+def _titleize(key: str) -> str:
+    """Turn a snake_case key into a display heading (keys repeat a lot)"""
+    return key.replace("_", " ").title()
+
+
+def create_markdown_report(results: Dict[str, Any], output_path: Path):
+    """Render a human-readable markdown report from analysis results"""
+    meta = results["metadata"]
+    stats = results["statistics"]
+
+    lines = [
+        f"# Aggregate Analysis: {meta['keyword']}",
+        "",
+        f"*Analyzed {meta['post_count']} posts ({meta['image_count']} images) "
+        f"via {meta['provider']} on {meta['analyzed_at']}*",
+        "",
+        "## Statistics",
+        "",
+        f"- Total likes: {stats['total_likes']:,}",
+        f"- Total comments: {stats['total_comments']:,}",
+        f"- Total shares: {stats['total_shares']:,}",
+        f"- Top authors: {', '.join(name for name, _ in stats['top_authors'])}",
+    ]
+
+    for analysis_type, payload in results["analysis"].items():
+        lines.append("")
+        lines.append(f"## {_titleize(analysis_type)}")
+        lines.append("")
+
+        if isinstance(payload, dict):
+            for key, value in payload.items():
+                lines.append(f"### {_titleize(key)}")
+                if isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, (dict, list)):
+                            lines.append(f"- {orjson.dumps(item).decode()}")
+                        else:
+                            lines.append(f"- {item}")
+                elif isinstance(value, dict):
+                    lines.append("```json")
+                    lines.append(orjson.dumps(value, option=orjson.OPT_INDENT_2).decode())
+                    lines.append("```")
+                else:
+                    lines.append(str(value))
+                lines.append("")
+        else:
+            lines.append(str(payload))
+
+    output_path.write_text("\n".join(lines), encoding="utf-8")
+    console.print(f"[green]Report saved to {output_path}[/green]")
+
+
+def analyze_downloaded_content(
+    keyword: Optional[str] = None,
+    analysis_types: Optional[List[str]] = None,
+    provider_name: str = "openai",
+    use_latest: bool = False,
+    use_cache: bool = True,
+    batch_types: bool = False,
+    non_interactive: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """Locate a downloaded-content folder and analyze it"""
+    if not DOWNLOADED_ROOT.exists():
+        console.print(f"[red]No downloaded content found at {DOWNLOADED_ROOT}[/red]")
+        return None
+
+    date_folders = sorted(d for d in DOWNLOADED_ROOT.iterdir() if d.is_dir())
+    if not date_folders:
+        console.print("[red]No scrape folders found.[/red]")
+        return None
+
+    keyword_path: Optional[Path] = None
+
+    if use_latest:
+        # Scan date folders newest-first; DirEntry.stat() reuses the stat
+        # data fetched during the directory read, and once a date folder
+        # yields a candidate no older date can beat it.
+        for date_folder in reversed(date_folders):
+            best_mtime = -1.0
+            with os.scandir(date_folder) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                    if mtime > best_mtime:
+                        best_mtime = mtime
+                        keyword_path = Path(entry.path)
+            if keyword_path is not None:
+                break
+        if keyword_path is None:
+            console.print("[red]No keyword folders found.[/red]")
+            return None
+    elif keyword:
+        for date_folder in reversed(date_folders):
+            candidate = date_folder / keyword
+            if candidate.is_dir():
+                keyword_path = candidate
+                break
+        if keyword_path is None:
+            console.print(f"[red]No folder found for keyword: {keyword}[/red]")
+            return None
+    else:
+        available = [
+            kw for date_folder in date_folders
+            for kw in sorted(date_folder.iterdir()) if kw.is_dir()
+        ]
+        if not available:
+            console.print("[red]No keyword folders found.[/red]")
+            return None
+        if non_interactive or not sys.stdin.isatty():
+            # Batch runs (CI, xargs/parallel) must never block on input()
+            keyword_path = available[0]
+            console.print(f"[bold]Non-interactive: analyzing {keyword_path}[/bold]")
+        else:
+            console.print("[bold]Available folders:[/bold]")
+            for idx, folder in enumerate(available, 1):
+                console.print(f"  {idx}. {folder.parent.name}/{folder.name}")
+            choice = input("Select folder number: ").strip()
+            try:
+                keyword_path = available[int(choice) - 1]
+            except (ValueError, IndexError):
+                console.print("[red]Invalid selection.[/red]")
+                return None
+
+    return analyze_aggregated_content(
+        keyword_path,
+        analysis_types or ["themes"],
+        provider_name=provider_name,
+        use_cache=use_cache,
+        batch_types=batch_types,
+    )
+
+
+def main():
+    """Main CLI interface"""
+    config = load_analysis_config()
+    type_flags = sorted(config["analysis_types"].keys())
+    preset_names = sorted(config.get("presets", {}).keys())
+
+    parser = argparse.ArgumentParser(description="Analyze downloaded Xiaohongshu content")
+    parser.add_argument("-k", "--keyword", help="Keyword folder to analyze")
+    parser.add_argument("--latest", action="store_true", help="Analyze the most recent scrape")
+    parser.add_argument("-p", "--provider", default=config.get("default_provider", "openai"),
+                        help="LLM provider (openai, deepseek, gemini, moonshot)")
+    parser.add_argument("--preset", choices=preset_names, help="Named bundle of analysis types")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the LLM response cache")
+    parser.add_argument("--batch-types", action="store_true",
+                        help="Request all analysis types in a single LLM call")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="Never prompt; default to the first available folder")
+    for flag in type_flags:
+        parser.add_argument(f"--{flag.replace('_', '-')}", dest=flag, action="store_true",
+                            help=f"Run {flag.replace('_', ' ')} analysis")
+
+    args = parser.parse_args()
+
+    analysis_types: List[str] = []
+    if args.preset:
+        analysis_types.extend(config["presets"][args.preset])
+    for flag in type_flags:
+        if getattr(args, flag, False) and flag not in analysis_types:
+            analysis_types.append(flag)
+    if not analysis_types:
+        analysis_types = ["themes"]
+
+    analyze_downloaded_content(
+        keyword=args.keyword,
+        analysis_types=analysis_types,
+        provider_name=args.provider,
+        use_latest=args.latest,
+        use_cache=not args.no_cache,
+        batch_types=args.batch_types,
+        non_interactive=args.yes,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Cross-folder LLM analysis for Xiaohongshu content
+Merges several keyword folders into one corpus and runs the same aggregate
+analysis types as analyze.py, for comparing related searches.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Try importing dependencies
+try:
+    from rich.console import Console
+    from utils.llm_providers import LLMFactory
+except ImportError:
+    print("Error: Analysis dependencies not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+from analyze import (
+    DOWNLOADED_ROOT,
+    PROMPT_HEADER,
+    _chunk_corpus,
+    calculate_statistics,
+    deduplicate_texts,
+    collect_all_content,
+    create_markdown_report,
+    load_analysis_config,
+    run_analyses,
+    run_analyses_chunked,
+    write_results_file,
+)
+
+console = Console()
+
+MULTI_OUTPUT_ROOT = Path("data/analysis")
+
+
+def analyze_multiple_folders(
+    keyword_paths: List[Path],
+    analysis_types: List[str],
+    provider_name: str = "openai",
+    use_cache: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """Run aggregate analysis over the combined content of several folders"""
+    config = load_analysis_config()
+    llm = LLMFactory.create_provider(provider_name)
+
+    all_texts: List[str] = []
+    all_metadata: List[Dict] = []
+    folder_summaries = []
+
+    for keyword_path in keyword_paths:
+        console.print(f"[bold]Collecting {keyword_path}...[/bold]")
+        texts, metadata, images = collect_all_content(keyword_path)
+        all_texts.extend(texts)
+        all_metadata.extend(metadata)
+        folder_summaries.append({
+            "folder": str(keyword_path),
+            "keyword": keyword_path.name,
+            "post_count": len(metadata),
+            "image_count": len(images),
+        })
+
+    if not all_texts:
+        console.print("[red]No post text found in the selected folders.[/red]")
+        return None
+
+    all_texts, dedup_ratio = deduplicate_texts(all_texts)
+    chunks = _chunk_corpus(all_texts)
+    corpus = chunks[0]
+
+    post_count = len(all_metadata)
+    keywords = [s["keyword"] for s in folder_summaries]
+    console.print(f"  {post_count} posts across {len(keyword_paths)} folders, "
+                  f"{len(chunks)} corpus chunk{'s' if len(chunks) != 1 else ''}")
+
+    results: Dict[str, Any] = {
+        "metadata": {
+            "keywords": keywords,
+            "folders": folder_summaries,
+            "post_count": post_count,
+            "provider": provider_name,
+            "dedup_ratio": round(dedup_ratio, 3),
+            "analyzed_at": datetime.now().isoformat(),
+        },
+        "statistics": calculate_statistics(all_metadata),
+        "analysis": {},
+    }
+
+    corpus_prefix = f"{PROMPT_HEADER}{corpus}"
+
+    # Resolve prompt templates once so the dispatch path only formats strings
+    prompts_by_type = {}
+    for analysis_type in analysis_types:
+        text_prompt = config["analysis_types"].get(analysis_type, {}).get("text_prompt", "")
+        if text_prompt:
+            prompts_by_type[analysis_type] = text_prompt
+        else:
+            console.print(f"[yellow]Unknown analysis type: {analysis_type}, skipping[/yellow]")
+
+    context_note = (
+        f"The corpus above contains {post_count} posts collected across "
+        f"related searches: {', '.join(keywords)}."
+    )
+
+    def _build_suffix(analysis_type: str):
+        text_prompt = prompts_by_type.get(analysis_type)
+        if text_prompt is None:
+            return None
+        return f"{context_note}\n\n{text_prompt}"
+
+    # Merged corpora are the most likely to exceed one chunk; map-reduce
+    # over the chunks exactly as the single-folder path does.
+    if len(chunks) > 1:
+        analyses = run_analyses_chunked(
+            llm,
+            chunks,
+            analysis_types,
+            _build_suffix,
+            key_fields=(provider_name, "multi"),
+            use_cache=use_cache,
+            max_concurrent=config.get("max_concurrent_llm", 5),
+        )
+    else:
+        analyses = run_analyses(
+            llm,
+            corpus_prefix,
+            analysis_types,
+            _build_suffix,
+            key_fields=(provider_name, "multi"),
+            use_cache=use_cache,
+            max_concurrent=config.get("max_concurrent_llm", 5),
+        )
+
+    for analysis_type, response in analyses:
+        results["analysis"][analysis_type] = response
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_dir = MULTI_OUTPUT_ROOT / f"multi_{timestamp}"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    output_file = output_dir / "analysis.json"
+    write_results_file(output_file, results)
+    console.print(f"[green]Results saved to {output_file}[/green]")
+
+    # Reuse the single-folder report renderer; patch in a display keyword
+    results["metadata"]["keyword"] = " + ".join(keywords)
+    results["metadata"]["image_count"] = sum(s["image_count"] for s in folder_summaries)
+    create_markdown_report(results, output_dir / "analysis_report.md")
+    return results
+
+
+def _discover_keyword_folders() -> List[Path]:
+    """List all keyword folders across scrape dates, oldest date first"""
+    if not DOWNLOADED_ROOT.exists():
+        return []
+    folders = []
+    for date_folder in sorted(d for d in DOWNLOADED_ROOT.iterdir() if d.is_dir()):
+        folders.extend(kw for kw in sorted(date_folder.iterdir()) if kw.is_dir())
+    return folders
+
+
+def main():
+    """Main CLI interface"""
+    config = load_analysis_config()
+    preset_names = sorted(config.get("presets", {}).keys())
+
+    parser = argparse.ArgumentParser(description="Analyze multiple keyword folders together")
+    parser.add_argument("folders", nargs="*", help="Keyword folder paths to combine")
+    parser.add_argument("-p", "--provider", default=config.get("default_provider", "openai"),
+                        help="LLM provider (openai, deepseek, gemini, moonshot)")
+    parser.add_argument("--preset", choices=preset_names, default="marketing_core",
+                        help="Named bundle of analysis types")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the LLM response cache")
+    parser.add_argument("--all", action="store_true",
+                        help="Never prompt; analyze all available folders")
+    args = parser.parse_args()
+
+    if args.folders:
+        keyword_paths = [Path(f) for f in args.folders]
+    else:
+        available = _discover_keyword_folders()
+        if not available:
+            console.print("[red]No downloaded content folders found.[/red]")
+            return
+        if args.all or not sys.stdin.isatty():
+            # Batch runs (CI, xargs/parallel) must never block on input()
+            keyword_paths = available
+            console.print(f"[bold]Non-interactive: analyzing all {len(available)} folders[/bold]")
+        else:
+            console.print("[bold]Available folders:[/bold]")
+            for idx, folder in enumerate(available, 1):
+                console.print(f"  {idx}. {folder.parent.name}/{folder.name}")
+            choice = input("Folder numbers (comma separated, or 'all'): ").strip()
+            if choice.lower() == "all":
+                keyword_paths = available
+            else:
+                try:
+                    keyword_paths = [available[int(c) - 1] for c in choice.split(",")]
+                except (ValueError, IndexError):
+                    console.print("[red]Invalid selection.[/red]")
+                    return
+
+    missing = [p for p in keyword_paths if not p.is_dir()]
+    if missing:
+        console.print(f"[red]Folders not found: {', '.join(str(m) for m in missing)}[/red]")
+        return
+
+    analyze_multiple_folders(
+        keyword_paths,
+        config["presets"][args.preset],
+        provider_name=args.provider,
+        use_cache=not args.no_cache,
+    )
+
+
+if __name__ == "__main__":
+    main()
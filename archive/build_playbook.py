@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+"""
+Build the brand playbook and semiotic atlas from per-post analysis JSON
+Loads the markdown analyses saved alongside each scraped post, splits them
+into the canonical report sections, surfaces the top phrases per section and
+scores each phrase by adoption (document frequency) and distinctiveness
+(1 - normalized entropy across competitor groups). Writes brand_playbook.csv
+plus the semiotic atlas and trend radar PNGs consumed by the report step.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    import pandas as pd
+    import matplotlib
+    matplotlib.use("Agg")  # PNG-only output; skip interactive backend setup
+    import matplotlib.pyplot as plt
+    from matplotlib.lines import Line2D
+except ImportError:
+    print("Error: Playbook dependencies not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+# The atlas needs heavyweight optional extras; degrade gracefully without
+# them (umap-learn is imported lazily inside reduce_2d)
+try:
+    import ahocorasick  # pyahocorasick: one scan per doc for all phrases
+except ImportError:
+    ahocorasick = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from scipy import sparse as sp_sparse
+    from sklearn.feature_extraction.text import CountVectorizer
+except ImportError:
+    CountVectorizer = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from config_loader import get_config  # noqa: E402
+
+CANON_SECTIONS: Tuple[str, ...] = (
+    "Consumer Language",
+    "Visual Language",
+    "Occasions",
+    "Price Perception",
+    "Pain Points",
+)
+
+# Markdown section headers inside an analysis document, e.g. "## 3. Occasions"
+SECTION_HEADER_RE = re.compile(r"^(#{1,4})\s+(.+?)\s*$", re.MULTILINE)
+
+_SECTION_NOISE_RE = re.compile(r"^[\d\s.):]+|[\s:*]+$")
+
+# Competitor group -> filename pattern; first match wins, unmatched docs
+# land in "other"
+DEFAULT_GROUP_MAP: Dict[str, str] = {
+    "domestic": r"国产|国货|domestic",
+    "international": r"进口|海外|international|global",
+    "niche": r"小众|手作|niche|indie",
+}
+
+DEFAULT_THRESHOLDS: Dict[str, float] = {
+    "safe_adoption_min": 0.25,
+    "safe_distinct_max": 0.45,
+    "momentum_adoption_min": 0.15,
+    "momentum_distinct_min": 0.45,
+    "edge_adoption_max": 0.15,
+    "edge_distinct_min": 0.55,
+}
+
+DEFAULT_EMBED_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+# Words / CJK runs of at least two characters; used for phrase candidates
+_PHRASE_TOKEN_RE = re.compile(r"[\w一-鿿]{2,}")
+
+
+@lru_cache(maxsize=None)
+def normalize_section_name(raw: str) -> Optional[str]:
+    """Map a raw markdown header to a canonical section name (or None).
+
+    Headers repeat heavily across documents, so the regex cleanup and
+    canonical scan run once per distinct header string.
+    """
+    cleaned = _SECTION_NOISE_RE.sub("", raw).lower()
+    if not cleaned:
+        return None
+    for canon in CANON_SECTIONS:
+        canon_l = canon.lower()
+        if canon_l in cleaned or cleaned in canon_l:
+            return canon
+    return None
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """Split a markdown analysis into canonical sections keyed by name.
+
+    One multiline finditer pass locates every header; each section body
+    is a single slice of the original text between successive header
+    spans, with no per-line regex calls or join buffers.
+    """
+    sections: Dict[str, str] = {}
+    matches = list(SECTION_HEADER_RE.finditer(text))
+    for i, match in enumerate(matches):
+        name = normalize_section_name(match.group(2))
+        if name is None:
+            continue
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        body = text[match.end():end].strip()
+        if body:
+            sections[name] = body
+    return sections
+
+
+def _parse_analysis_file(path: Path) -> Optional[Dict[str, str]]:
+    """Read, parse and section-split one analysis JSON file (or None)"""
+    try:
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (ValueError, OSError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    analysis = data.get("analysis") or data.get("analysis_text") or ""
+    if not analysis:
+        return None
+    row = {"filename": path.name, "analysis": analysis}
+    doc_sections = split_sections(analysis)
+    for sec in CANON_SECTIONS:
+        row[f"sec::{sec}"] = doc_sections.get(sec, "")
+    return row
+
+
+def load_json_rows(json_dir: Path) -> "pd.DataFrame":
+    """Load per-post analysis JSON files into a sectioned DataFrame.
+
+    Files are parsed with orjson when installed and read through a thread
+    pool so disk I/O, JSON decode and section splitting overlap across
+    files; the DataFrame is built once from the surviving rows.
+    """
+    paths = sorted(json_dir.glob("*.json"))
+    if not paths:
+        return pd.DataFrame()
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(32, (os.cpu_count() or 4) * 2, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        rows = [row for row in pool.map(_parse_analysis_file, paths) if row is not None]
+    return pd.DataFrame(rows)
+
+
+def _compile_group_patterns(group_map: Dict[str, str]) -> List[Tuple[str, "re.Pattern"]]:
+    """Compile the group regexes once, preserving priority order"""
+    return [(name, re.compile(pattern, re.IGNORECASE))
+            for name, pattern in group_map.items() if name != "other"]
+
+
+def assign_group(filename: str, compiled_patterns: List[Tuple[str, "re.Pattern"]]) -> str:
+    """Assign a single document to the first matching competitor group"""
+    for name, pattern in compiled_patterns:
+        if pattern.search(filename):
+            return name
+    return "other"
+
+
+def assign_groups(filenames: "pd.Series", group_map: Dict[str, str]) -> "np.ndarray":
+    """Vectorized group assignment for a whole filename column.
+
+    Each precompiled pattern runs as one str.contains pass; earlier
+    groups win ties, matching assign_group's first-match semantics.
+    """
+    out = np.full(len(filenames), "other", dtype=object)
+    unassigned = np.ones(len(filenames), dtype=bool)
+    for name, pattern in _compile_group_patterns(group_map):
+        mask = filenames.str.contains(pattern, na=False).to_numpy()
+        take = mask & unassigned
+        out[take] = name
+        unassigned[take] = False
+    return out
+
+
+def extract_top_phrases(texts: List[str], top_n: int = 15) -> List[str]:
+    """Most common phrase tokens across the given (lowercased) texts.
+
+    Counts document frequency (a phrase counts once per document) so a
+    single verbose post can't dominate the section.
+    """
+    counter: Counter = Counter()
+    for txt in texts:
+        if txt:
+            counter.update(set(_PHRASE_TOKEN_RE.findall(txt)))
+    return [phrase for phrase, _ in counter.most_common(top_n)]
+
+
+def phrase_counts_matrix(
+    phrase_specs: List[Tuple[str, str]],
+    lower_by_sec: Dict[str, "pd.Series"],
+    group_codes: "np.ndarray",
+    n_groups: int,
+    lower_texts_by_sec: Optional[Dict[str, List[str]]] = None,
+) -> "np.ndarray":
+    """(P, G) per-group document-frequency counts for all phrases at once.
+
+    With pyahocorasick installed, every document is scanned exactly once
+    for ALL of its section's phrases simultaneously (O(D·L) instead of
+    O(P·D·L)); hits are deduped per document so the numbers stay document
+    frequencies. Without it, falls back to one vectorized str.contains
+    pass per phrase over the pre-lowered section columns.
+    """
+    counts = np.zeros((len(phrase_specs), n_groups), dtype=np.int64)
+    if lower_texts_by_sec is None:
+        lower_texts_by_sec = {sec: series.tolist() for sec, series in lower_by_sec.items()}
+
+    if ahocorasick is None and CountVectorizer is not None:
+        # Linear-algebra reformulation: one binary (docs x phrases) hit
+        # matrix per section, then group counts fall out of a single
+        # sparse product with the one-hot group indicator. Character
+        # n-grams spanning the phrase lengths reproduce the substring
+        # semantics of the other two paths (`phrase in text`), so the
+        # counts do not depend on which optional package is installed.
+        n_docs = len(group_codes)
+        one_hot = sp_sparse.csr_matrix(
+            (np.ones(n_docs), (np.arange(n_docs), group_codes)),
+            shape=(n_docs, n_groups),
+        )
+        for sec in CANON_SECTIONS:
+            rows = [i for i, (s, _) in enumerate(phrase_specs) if s == sec]
+            if not rows:
+                continue
+            vocab = {phrase_specs[i][1]: j for j, i in enumerate(rows)}
+            lengths = [len(phrase_specs[i][1]) for i in rows]
+            vect = CountVectorizer(vocabulary=vocab, binary=True, lowercase=False,
+                                   analyzer="char",
+                                   ngram_range=(min(lengths), max(lengths)))
+            hits = vect.transform(lower_texts_by_sec[sec])
+            counts[np.asarray(rows)] = (one_hot.T @ hits).toarray().T.astype(np.int64)
+        return counts
+
+    if ahocorasick is None:
+        # Invert the corpus once into per-(section, group) text lists; each
+        # phrase then scans only its section's buckets with a plain `in`
+        # test — the DataFrame is never re-split per phrase
+        buckets: Dict[str, List[List[str]]] = {
+            sec: [[] for _ in range(n_groups)] for sec in CANON_SECTIONS
+        }
+        for sec in CANON_SECTIONS:
+            sec_buckets = buckets[sec]
+            for text, code in zip(lower_texts_by_sec[sec], group_codes):
+                if text:
+                    sec_buckets[code].append(text)
+        for i, (sec, phrase) in enumerate(phrase_specs):
+            sec_buckets = buckets[sec]
+            for group in range(n_groups):
+                counts[i, group] = sum(1 for text in sec_buckets[group] if phrase in text)
+        return counts
+
+    # One phrase string can be a top phrase in several sections, so each
+    # automaton word carries the full list of (section, row) entries
+    word_rows: Dict[str, List[Tuple[str, int]]] = {}
+    for i, (sec, phrase) in enumerate(phrase_specs):
+        word_rows.setdefault(phrase, []).append((sec, i))
+    automaton = ahocorasick.Automaton()
+    for phrase, entries in word_rows.items():
+        automaton.add_word(phrase, entries)
+    automaton.make_automaton()
+
+    for sec in CANON_SECTIONS:
+        for doc_idx, text in enumerate(lower_texts_by_sec[sec]):
+            if not text:
+                continue
+            hit_rows = set()
+            for _, entries in automaton.iter(text):
+                for entry_sec, row in entries:
+                    if entry_sec == sec:
+                        hit_rows.add(row)
+            if hit_rows:
+                group = group_codes[doc_idx]
+                for row in hit_rows:
+                    counts[row, group] += 1
+    return counts
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _entropy_rows_jit(counts):
+        n_rows, n_groups = counts.shape
+        out = np.empty(n_rows, dtype=np.float64)
+        log_g = math.log(n_groups)
+        for i in prange(n_rows):
+            total = 0
+            for j in range(n_groups):
+                total += counts[i, j]
+            if total == 0:
+                out[i] = 0.0
+                continue
+            entropy = 0.0
+            for j in range(n_groups):
+                if counts[i, j] > 0:
+                    p = counts[i, j] / total
+                    entropy -= p * math.log(p)
+            out[i] = entropy / log_g
+        return out
+
+
+def normalized_entropy(counts: "np.ndarray") -> "np.ndarray":
+    """Row-wise normalized Shannon entropy of a (P, G) counts matrix.
+
+    JIT-compiled with numba when installed; otherwise a vectorized numpy
+    pass. Rows with no hits come back as 0.0.
+    """
+    if counts.shape[1] < 2:
+        return np.zeros(counts.shape[0], dtype=np.float64)
+    if njit is not None:
+        return _entropy_rows_jit(counts)
+    totals = counts.sum(axis=1).astype(np.float64)
+    p = counts / np.maximum(totals, 1.0)[:, None]
+    plogp = np.where(counts > 0, p * np.log(np.where(p > 0, p, 1.0)), 0.0)
+    return -plogp.sum(axis=1) / math.log(counts.shape[1])
+
+
+def classify_quadrant(
+    adoption: float,
+    distinctiveness: float,
+    thresholds: Optional[Dict[str, float]] = None,
+) -> str:
+    """Place a phrase in one of the four playbook quadrants"""
+    merged = dict(DEFAULT_THRESHOLDS)
+    if thresholds:
+        merged.update(thresholds)
+    if adoption >= merged["safe_adoption_min"] and distinctiveness <= merged["safe_distinct_max"]:
+        return "Safe to Borrow"
+    if (adoption >= merged["momentum_adoption_min"]
+            and distinctiveness >= merged["momentum_distinct_min"]):
+        return "Momentum Bet"
+    if adoption <= merged["edge_adoption_max"] and distinctiveness >= merged["edge_distinct_min"]:
+        return "Edge / Risky"
+    return "Watchlist"
+
+
+def classify_quadrants(
+    adoption: "np.ndarray",
+    distinctiveness: "np.ndarray",
+    thresholds: Optional[Dict[str, float]] = None,
+) -> "np.ndarray":
+    """Vectorized classify_quadrant over whole adoption/distinctiveness arrays.
+
+    The threshold dict is merged once, and the rules are applied as boolean
+    masks from lowest to highest priority so later assignments win exactly
+    like the scalar if-chain.
+    """
+    merged = dict(DEFAULT_THRESHOLDS)
+    if thresholds:
+        merged.update(thresholds)
+    quadrants = np.full(adoption.shape[0], "Watchlist", dtype=object)
+    quadrants[(adoption <= merged["edge_adoption_max"])
+              & (distinctiveness >= merged["edge_distinct_min"])] = "Edge / Risky"
+    quadrants[(adoption >= merged["momentum_adoption_min"])
+              & (distinctiveness >= merged["momentum_distinct_min"])] = "Momentum Bet"
+    quadrants[(adoption >= merged["safe_adoption_min"])
+              & (distinctiveness <= merged["safe_distinct_max"])] = "Safe to Borrow"
+    return quadrants
+
+
+def _example_for(phrase_lower: str, lower_texts: List[str], original_texts: List[str]) -> str:
+    """Short snippet around the first occurrence of a phrase"""
+    for lowered, original in zip(lower_texts, original_texts):
+        pos = lowered.find(phrase_lower)
+        if pos != -1:
+            start = max(0, pos - 40)
+            return " ".join(original[start:pos + 100].split())
+    return ""
+
+
+def build_playbook(
+    json_dir: Path,
+    out_dir: Path,
+    group_map: Optional[Dict[str, str]] = None,
+    top_per_section: int = 15,
+    thresholds: Optional[Dict[str, float]] = None,
+) -> "pd.DataFrame":
+    """Score top phrases per section and write brand_playbook.csv"""
+    group_map = group_map or DEFAULT_GROUP_MAP
+    df_docs = load_json_rows(Path(json_dir))
+    if df_docs.empty:
+        print(f"No analysis JSON found in {json_dir}; nothing to build")
+        return pd.DataFrame()
+
+    df_docs["group"] = assign_groups(df_docs["filename"], group_map)
+    group_names = tuple(dict.fromkeys(list(group_map) + ["other"]))
+    group_codes = pd.Categorical(
+        df_docs["group"], categories=list(group_names)
+    ).codes.astype(np.int64)
+    n_docs = len(df_docs)
+
+    # Lowercase each section column once up front; every phrase scan below
+    # reuses these Series (and the matching Python lists) instead of
+    # re-lowering or re-materializing per phrase
+    lower_by_sec = {
+        sec: df_docs[f"sec::{sec}"].fillna("").str.lower() for sec in CANON_SECTIONS
+    }
+    lower_texts_by_sec = {sec: series.tolist() for sec, series in lower_by_sec.items()}
+
+    phrase_specs: List[Tuple[str, str]] = []
+    for sec in CANON_SECTIONS:
+        for phrase in extract_top_phrases(lower_texts_by_sec[sec], top_per_section):
+            phrase_specs.append((sec, phrase))
+
+    counts_matrix = phrase_counts_matrix(phrase_specs, lower_by_sec, group_codes,
+                                         len(group_names),
+                                         lower_texts_by_sec=lower_texts_by_sec)
+
+    # Entropy/distinctiveness for every phrase in one row-wise pass
+    doc_freqs = counts_matrix.sum(axis=1)
+    adoption_arr = doc_freqs / n_docs
+    distinct_arr = 1.0 - normalized_entropy(counts_matrix)
+
+    # Columnar assembly: plain arrays/lists in, one DataFrame out — no
+    # per-row dicts and no iterrows round-trip for the quadrants
+    originals_by_sec = {
+        sec: df_docs[f"sec::{sec}"].fillna("").tolist() for sec in CANON_SECTIONS
+    }
+    examples = [_example_for(phrase, lower_texts_by_sec[sec], originals_by_sec[sec])
+                for sec, phrase in phrase_specs]
+    quadrants = classify_quadrants(adoption_arr, distinct_arr, thresholds)
+    phrases_df = pd.DataFrame({
+        "section": [sec for sec, _ in phrase_specs],
+        "phrase": [phrase for _, phrase in phrase_specs],
+        "doc_freq": doc_freqs,
+        "adoption": adoption_arr,
+        "distinctiveness": distinct_arr,
+        "quadrant": quadrants,
+        "example_sentence": examples,
+    })
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = out_dir / "brand_playbook.csv"
+    phrases_df.to_csv(csv_path, index=False)
+    print(f"Wrote {len(phrases_df)} playbook phrases -> {csv_path}")
+    return phrases_df
+
+
+def embed_texts(texts: List[str], model_name: str = DEFAULT_EMBED_MODEL) -> "np.ndarray":
+    """Embed phrase labels with a multilingual SentenceTransformer.
+
+    Inputs are sorted by length first (SBERT-style smart batching) so each
+    batch pads to similar lengths instead of the batch maximum, then the
+    permutation is inverted. encode() normalizes and returns numpy itself,
+    dropping the extra copy and manual norm pass.
+    """
+    import torch
+
+    torch.set_num_threads(os.cpu_count() or 1)
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = SentenceTransformer(model_name, device=device)
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    emb_sorted = model.encode(
+        [texts[i] for i in order],
+        batch_size=64,
+        show_progress_bar=False,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+    )
+    emb = np.empty_like(emb_sorted)
+    emb[order] = emb_sorted
+    # Normalized unit vectors lose nothing that matters to a 2D layout in
+    # half precision, and FP16 halves cache files and memory bandwidth
+    return emb.astype(np.float16)
+
+
+def _cached_embeddings(phrases: List[str], model_name: str, out_dir: Path) -> "np.ndarray":
+    """Phrase embeddings with an on-disk cache keyed by model + phrase list.
+
+    Repeat runs over the same playbook skip the model load and encode
+    entirely and just np.load the saved vectors.
+    """
+    key = hashlib.sha1((model_name + "|" + "\n".join(phrases)).encode("utf-8")).hexdigest()
+    cache_path = Path(out_dir) / f"phrase_emb_{key}.npy"
+    if cache_path.exists():
+        return np.load(cache_path)
+    emb = embed_texts(phrases, model_name)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(cache_path, emb)
+    return emb
+
+
+def reduce_2d(vectors: "np.ndarray", random_state: Optional[int] = 42) -> "np.ndarray":
+    """Project embedding vectors to 2D (UMAP; PCA for tiny inputs).
+
+    Uses cuML's GPU UMAP when a CUDA stack is installed; otherwise runs
+    umap-learn on CPU. Vectors may arrive in FP16; the reducers want
+    float32, so the up-cast happens only here at the boundary.
+    """
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    n_points = vectors.shape[0]
+    if n_points < 30:
+        # Tiny atlases: PCA is more than adequate for normalized vectors
+        # and skips UMAP's import + one-time numba JIT cost entirely
+        from sklearn.decomposition import PCA
+        return PCA(n_components=2).fit_transform(vectors)
+    # Atlases are small (tens of phrases): 100 epochs converges fine and
+    # the default 500 is pure wall time
+    core = dict(n_neighbors=min(10, n_points - 1), min_dist=0.15, n_epochs=100)
+    try:
+        from cuml.manifold import UMAP as cuUMAP
+        import cupy
+    except ImportError:
+        pass
+    else:
+        reducer = cuUMAP(random_state=random_state, **core)
+        return cupy.asnumpy(reducer.fit_transform(cupy.asarray(vectors)))
+    try:
+        import umap
+    except ImportError:
+        print("umap-learn not installed; falling back to a PCA projection")
+        from sklearn.decomposition import PCA
+        return PCA(n_components=2).fit_transform(vectors)
+    params = dict(metric="cosine", low_memory=True, init="pca", **core)
+    if random_state is None:
+        # a fixed seed forces single-threaded layout; no seed means all cores
+        params["n_jobs"] = -1
+    else:
+        params["random_state"] = random_state
+    return umap.UMAP(**params).fit_transform(vectors)
+
+
+def plot_semiotic_atlas(
+    phrases_df: "pd.DataFrame",
+    out_dir: Path,
+    model_name: str = DEFAULT_EMBED_MODEL,
+) -> Optional[Path]:
+    """Embed the playbook phrases and plot them as a 2D semiotic atlas"""
+    if SentenceTransformer is None:
+        print("Skipping semiotic atlas (install sentence-transformers)")
+        return None
+    if phrases_df.empty:
+        return None
+
+    phrases = phrases_df["phrase"].tolist()
+    sections = phrases_df["section"].tolist()
+    xy = reduce_2d(_cached_embeddings(phrases, model_name, out_dir))
+
+    # One scatter call with an integer color array instead of one call per
+    # section; the legend comes from proxy handles, not artist labels
+    sec_list = list(dict.fromkeys(sections))
+    sec_index = {sec: i for i, sec in enumerate(sec_list)}
+    color_idx = np.fromiter((sec_index[s] for s in sections), dtype=int)
+    cmap = plt.get_cmap("tab10")
+    plt.figure(figsize=(12, 9))
+    plt.scatter(xy[:, 0], xy[:, 1], c=color_idx, cmap="tab10", vmin=0, vmax=9,
+                s=30, alpha=0.75, rasterized=True)
+    for j, phrase in enumerate(phrases):
+        plt.text(xy[j, 0], xy[j, 1], phrase, fontsize=7, alpha=0.8)
+    handles = [Line2D([], [], marker="o", linestyle="", color=cmap(i % 10), label=sec)
+               for i, sec in enumerate(sec_list)]
+    plt.legend(handles=handles, loc="best", fontsize=8)
+    plt.title("Semiotic Atlas — phrase space by section")
+    plt.axis("off")
+
+    out_path = Path(out_dir) / "semiotic_atlas.png"
+    plt.savefig(out_path, dpi=200, bbox_inches="tight")
+    plt.close()
+    print(f"Wrote semiotic atlas -> {out_path}")
+    return out_path
+
+
+def plot_trend_radar(playbook_df: "pd.DataFrame", out_dir: Path) -> Optional[Path]:
+    """Plot adoption vs distinctiveness with quadrant coloring"""
+    if playbook_df.empty:
+        return None
+    cmap = plt.get_cmap("tab10")
+    quadrant_cat = pd.Categorical(playbook_df["quadrant"])
+    plt.figure(figsize=(10, 8))
+    adoption = playbook_df["adoption"].to_numpy()
+    distinct = playbook_df["distinctiveness"].to_numpy()
+    plt.scatter(adoption, distinct, c=quadrant_cat.codes, cmap="tab10", vmin=0, vmax=9,
+                s=36, alpha=0.8, rasterized=True)
+    for x, y, phrase in zip(adoption, distinct, playbook_df["phrase"]):
+        plt.text(x, y, phrase, fontsize=6, alpha=0.7)
+    plt.xlabel("Adoption (doc frequency)")
+    plt.ylabel("Distinctiveness (1 - normalized entropy)")
+    plt.title("Trend Radar")
+    handles = [Line2D([], [], marker="o", linestyle="", color=cmap(i % 10), label=quadrant)
+               for i, quadrant in enumerate(quadrant_cat.categories)]
+    plt.legend(handles=handles, loc="best", fontsize=8)
+
+    out_path = Path(out_dir) / "trend_radar.png"
+    plt.savefig(out_path, dpi=200, bbox_inches="tight")
+    plt.close()
+    print(f"Wrote trend radar -> {out_path}")
+    return out_path
+
+
+def main():
+    """Main CLI interface"""
+    if len(sys.argv) < 2:
+        print("Usage: python archive/build_playbook.py <json_dir> [out_dir]")
+        sys.exit(1)
+    json_dir = Path(sys.argv[1])
+    if not json_dir.is_dir():
+        print(f"Error: analysis directory not found: {json_dir}")
+        sys.exit(1)
+    out_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else json_dir.parent / "step7_visualizations"
+
+    config = get_config()
+    top_per_section = config.get("playbook_top_per_section", 15)
+    playbook_df = build_playbook(json_dir, out_dir, top_per_section=top_per_section)
+    if not playbook_df.empty:
+        plot_semiotic_atlas(playbook_df, out_dir)
+        plot_trend_radar(playbook_df, out_dir)
+
+
+if __name__ == "__main__":
+    main()
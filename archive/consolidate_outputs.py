@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Consolidate workflow outputs into a flat client-deliverables folder
+Collects the reports, codebooks and visualizations produced by the analysis
+workflow steps (step5-7 + final reports) into one numbered directory with a
+README index, ready to hand over.
+"""
+
+import os
+import sys
+import errno
+import fnmatch
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# concurrent.futures and datetime are imported where used so the CLI
+# usage/error exits don't pay their import cost
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+_COPY_BUF_SIZE = 1 << 20  # 1 MiB read/write fallback buffer
+_FICLONE = 0x40049409  # linux/fs.h ioctl: reflink dst to src on CoW filesystems
+
+# Workflow output -> numbered deliverable name. A constant, so built once at
+# import time; wildcard and literal entries are partitioned up front to keep
+# the per-entry branch out of the copy loop.
+_COPY_MAPPING: Tuple[Tuple[str, str], ...] = (
+    ("final_reports/executive_summary.md", "01_executive_summary.md"),
+    ("final_reports/full_report.md", "02_executive_market_report.md"),
+    ("step5_insights/synthesis_*.md", "03_insight_synthesis.md"),
+    ("step5_insights/insight_extraction_report.md", "04_insight_extraction_report.md"),
+    ("step5_insights/opportunity_map.md", "05_opportunity_map.md"),
+    ("step6_themes/enriched_themes_report.md", "06_consumer_segments_detailed.md"),
+    ("step6_themes/master_codebook_*.md", "07_master_codebook.md"),
+    ("step6_themes/theme_frequencies.csv", "08_theme_frequencies.csv"),
+    ("final_reports/strategic_recommendations.md", "09_strategic_recommendations.md"),
+    ("final_reports/activation_playbook.md", "10_activation_playbook.md"),
+    ("step7_visualizations/semiotic_atlas.png", "11_semiotic_atlas.png"),
+    ("step7_visualizations/theme_network.png", "12_theme_network.png"),
+    ("step7_visualizations/territory_map.png", "13_territory_map.png"),
+)
+_LITERAL_PARSED = tuple(
+    (s, s.rpartition("/")[0], d) for s, d in _COPY_MAPPING if "*" not in s
+)
+# Wildcards pre-split into (pattern, parent, name) so the loop never parses
+# paths; Path construction is much slower than plain string joins.
+_WILDCARD_PARSED = tuple(
+    (s, str(Path(s).parent), Path(s).name, d) for s, d in _COPY_MAPPING if "*" in s
+)
+
+
+def _copy_bytes(src_fd: int, dst_fd: int, size: int) -> None:
+    """Move size bytes from src_fd to dst_fd with the fastest available syscall.
+
+    Tries a FICLONE reflink (metadata-only, O(1) on btrfs/XFS/APFS-style
+    CoW filesystems), then os.copy_file_range (server-side copy on NFS),
+    then os.sendfile, then a 1 MiB buffered read/write loop. On a mid-copy
+    fallback both descriptors are rewound and the destination truncated so
+    the slower path restarts from a clean slate.
+    """
+    def _rewind() -> None:
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError:
+            # EOPNOTSUPP / EXDEV: not a CoW filesystem or crossing mounts
+            pass
+
+    remaining = size
+    if hasattr(os, "copy_file_range"):
+        try:
+            while remaining > 0:
+                sent = os.copy_file_range(src_fd, dst_fd, remaining)
+                if sent == 0:
+                    return
+                remaining -= sent
+            return
+        except OSError as exc:
+            if exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL):
+                raise
+            _rewind()
+            remaining = size
+
+    if hasattr(os, "sendfile"):
+        try:
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                if sent == 0:
+                    return
+                offset += sent
+                remaining -= sent
+            return
+        except OSError as exc:
+            if exc.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK):
+                raise
+            _rewind()
+            remaining = size
+
+    # Plain read/write loop: the only fallback available on Windows
+    while remaining > 0:
+        chunk = os.read(src_fd, _COPY_BUF_SIZE)
+        if not chunk:
+            return
+        os.write(dst_fd, chunk)
+        remaining -= len(chunk)
+
+
+def _fast_copy(src: str, dst: str, src_stat: os.stat_result) -> None:
+    """Copy src to dst preserving mtime, reusing the caller's stat() result.
+
+    Skips the copy when the destination already matches on size + mtime
+    (cp -u style), which makes re-running the consolidate step a no-op.
+    """
+    try:
+        dst_st = os.stat(dst)
+        if (dst_st.st_size == src_stat.st_size
+                and dst_st.st_mtime_ns == src_stat.st_mtime_ns):
+            return
+    except FileNotFoundError:
+        pass
+    flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+    try:
+        src_fd = os.open(src, flags)
+    except PermissionError:
+        # O_NOATIME requires file ownership; retry without it
+        src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _copy_bytes(src_fd, dst_fd, src_stat.st_size)
+            os.fchmod(dst_fd, src_stat.st_mode & 0o777)
+            os.utime(dst_fd, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _snapshot_tree(workflow_dir: Path) -> Tuple[dict, set]:
+    """Single-pass stat snapshot of the workflow tree (depth 2).
+
+    One scandir walk replaces the per-entry exists()/glob() checks: every
+    mapping entry resolves against this in-memory index keyed by the
+    'subdir/name' relative path, including not-found results. Also returns
+    the set of subdirectories seen, so entries under a step folder that was
+    never produced can be skipped without any lookups at all.
+    """
+    present: dict = {}
+    seen_dirs: set = set()
+    try:
+        top = list(os.scandir(workflow_dir))
+    except FileNotFoundError:
+        return present, seen_dirs
+    for entry in top:
+        if entry.is_dir(follow_symlinks=False):
+            seen_dirs.add(entry.name)
+            for sub in os.scandir(entry.path):
+                if sub.is_file():
+                    present[f"{entry.name}/{sub.name}"] = sub.stat()
+        elif entry.is_file():
+            present[entry.name] = entry.stat()
+    return present, seen_dirs
+
+
+def consolidate_workflow_outputs(
+    workflow_dir: Path,
+    output_dir: Optional[Path] = None,
+) -> Tuple[List[str], List[str]]:
+    """Copy the client-facing workflow outputs into one flat deliverables folder"""
+    workflow_dir = Path(workflow_dir)
+    if output_dir is None:
+        output_dir = workflow_dir / "final_deliverables"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    copied_files: List[str] = []
+    missing_files: List[str] = []
+
+    present, seen_dirs = _snapshot_tree(workflow_dir)
+
+    print(f"Consolidating {workflow_dir} -> {output_dir}")
+
+    # Resolve every mapping entry to a concrete (src, dst, stat) task first,
+    # then run the copies concurrently: they are independent and I/O-bound,
+    # so overlapping per-file latency is nearly free wall-time.
+    # Compose task paths with plain string joins; only _fast_copy's fds ever
+    # touch the filesystem, so no Path objects are needed in the loop.
+    workflow_str = str(workflow_dir)
+    output_str = str(output_dir)
+
+    tasks: List[Tuple[str, str, str, os.stat_result]] = []
+    for source_pattern, parent_str, dest_name in _LITERAL_PARSED:
+        if parent_str not in seen_dirs:
+            missing_files.append(source_pattern)
+            continue
+        src_stat = present.get(source_pattern)
+        if src_stat is not None:
+            tasks.append((os.path.join(workflow_str, source_pattern),
+                          os.path.join(output_str, dest_name), dest_name, src_stat))
+        else:
+            missing_files.append(source_pattern)
+    for source_pattern, parent_str, name_pattern, dest_name in _WILDCARD_PARSED:
+        if parent_str not in seen_dirs:
+            missing_files.append(source_pattern)
+            continue
+        prefix = parent_str + "/"
+        matching = [(rel, st) for rel, st in present.items()
+                    if rel.startswith(prefix)
+                    and fnmatch.fnmatch(rel[len(prefix):], name_pattern)]
+        if matching:
+            # Newest match wins (reports are timestamped)
+            rel, src_stat = max(matching, key=lambda m: m[1].st_mtime)
+            tasks.append((os.path.join(workflow_str, rel),
+                          os.path.join(output_str, dest_name), dest_name, src_stat))
+        else:
+            missing_files.append(source_pattern)
+
+    if tasks:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=min(16, len(tasks))) as pool:
+            futures = {pool.submit(_fast_copy, src, dst, st): name
+                       for src, dst, name, st in tasks}
+            for future in as_completed(futures):
+                future.result()
+                copied_files.append(futures[future])
+                print(f"  + {futures[future]}")
+
+    _write_readme(output_dir, workflow_dir, copied_files, missing_files)
+    print(f"Copied {len(copied_files)} files ({len(missing_files)} missing)")
+    return copied_files, missing_files
+
+
+def _write_readme(
+    output_dir: Path,
+    workflow_dir: Path,
+    copied_files: List[str],
+    missing_files: List[str],
+) -> None:
+    """Write a README.md index for the deliverables folder"""
+    from datetime import datetime
+
+    parts: List[str] = [f"""# Final Deliverables
+
+Workflow: {workflow_dir.name}
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+
+## Contents
+
+"""]
+    # One pass over copied_files with disjoint prefix buckets; the old
+    # startswith('0') filter also matched the 06-09 segment/strategy files,
+    # double-listing them under Executive Reports.
+    exec_files: List[str] = []
+    seg_files: List[str] = []
+    strat_files: List[str] = []
+    viz_files: List[str] = []
+    for f in copied_files:
+        prefix = f[:2]
+        if prefix in ("01", "02", "03", "04", "05"):
+            exec_files.append(f)
+        elif prefix in ("06", "07", "08"):
+            seg_files.append(f)
+        elif prefix in ("09", "10"):
+            strat_files.append(f)
+        else:
+            viz_files.append(f)
+
+    for title, bucket in (("### Executive Reports\n", exec_files),
+                          ("\n### Consumer Segments\n", seg_files),
+                          ("\n### Strategy\n", strat_files),
+                          ("\n### Visualizations\n", viz_files)):
+        bucket.sort()
+        parts.append(title)
+        for f in bucket:
+            parts.append(f"- {f}\n")
+    if missing_files:
+        parts.append("\n## Not produced by this run\n")
+        for f in missing_files:
+            parts.append(f"- {f}\n")
+
+    readme_path = output_dir / "README.md"
+    # Pre-encoded bytes: one C-level write, no TextIOWrapper newline
+    # translation, identical output across platforms
+    readme_path.write_bytes("".join(parts).encode("utf-8"))
+
+
+def main():
+    """Main CLI interface"""
+    if len(sys.argv) < 2:
+        print("Usage: python archive/consolidate_outputs.py <workflow_dir> [output_dir]")
+        sys.exit(1)
+    workflow_dir = Path(sys.argv[1])
+    if not workflow_dir.is_dir():
+        print(f"Error: workflow directory not found: {workflow_dir}")
+        sys.exit(1)
+    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+    consolidate_workflow_outputs(workflow_dir, output_dir)
+
+
+if __name__ == "__main__":
+    main()
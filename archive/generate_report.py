@@ -0,0 +1,814 @@
+#!/usr/bin/env python3
+"""
+Render client report bundles from workflow step outputs
+Gathers the step5 insight files, step6 theme files and step7 visualization
+assets for a workflow, resolves them against a report template definition
+from pipeline_config.json, and renders a markdown (optionally DOCX via
+pandoc) report plus an asset bundle.
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import zipfile
+import argparse
+import tempfile
+import functools
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Try importing dependencies
+try:
+    import numpy as np
+    import pandas as pd
+    from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+except ImportError:
+    print("Error: Report dependencies not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+# Optional fast CSV reader; pandas' parser remains the fallback
+try:
+    import pyarrow.csv as _pacsv
+except ImportError:
+    _pacsv = None
+
+# Optional fast JSON serializer for the metadata manifest
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from config_loader import get_config  # noqa: E402
+
+QUADRANT_ORDER = ("Safe to Borrow", "Momentum Bet", "Edge / Risky", "Watchlist")
+
+# Hot-path patterns compiled once at import; extract_theme_metadata and the
+# snippet/heading helpers run once per theme/section file.
+_THEME_TITLE_RE = re.compile(r"\*\*Theme Title\*\*[:\-\s]+(.+)")
+_CORE_INSIGHT_RE = re.compile(r"\*\*Core Insight\*\*[:\-\s]+(.+)")
+_WS_RE = re.compile(r"\s+")
+# Matches the whole skippable preamble (headings, `*analyzed ...*` lines,
+# blank lines) in one anchored scan instead of a per-line loop
+_PREFIX_RE = re.compile(r"\A(?:(?:#[^\n]*|\*analyzed[^\n]*|[ \t]*)\n)*", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"\S+")
+_BULLET_RE = re.compile(r"^\s*[-*]\s+(.+)")
+
+
+# ---------------------------------------------------------------------------
+# Text helpers
+# ---------------------------------------------------------------------------
+
+def _read_text_fast(path: Path) -> str:
+    """Read and decode a UTF-8 file in two C-level calls.
+
+    read_bytes + one decode skips the TextIOWrapper incremental-decode
+    layer that read_text goes through; it adds up across the many
+    markdown files the gathers load.
+    """
+    return path.read_bytes().decode("utf-8")
+
+
+def normalize_section_key(name: str) -> str:
+    """Canonical section name -> snake_case lookup key"""
+    return _WS_RE.sub("_", name.strip().lower())
+
+
+def strip_heading_block(text: str) -> str:
+    """Drop the leading title/`*analyzed ...*` preamble from a step file.
+
+    A single anchored regex finds where the preamble ends; the result is a
+    slice of the original string, so multi-MB codebooks are never split
+    into a list of lines and re-joined.
+    """
+    return text[_PREFIX_RE.match(text).end():].strip()
+
+
+def truncate_markdown(text: str, words: int = 220) -> str:
+    """Clamp markdown to roughly `words` words, appending an ellipsis.
+
+    Walks word boundaries with finditer and slices the original string, so
+    no token list is materialized for text that is mostly kept whole.
+    """
+    for i, match in enumerate(_TOKEN_RE.finditer(text)):
+        if i == words:
+            return text[:match.start()].rstrip() + " …"
+    return text.strip()
+
+
+def extract_theme_metadata(text: str) -> Dict[str, Optional[str]]:
+    """Pull the theme title and core insight out of a theme cluster file"""
+    title_match = _THEME_TITLE_RE.search(text)
+    insight_match = _CORE_INSIGHT_RE.search(text)
+    return {
+        "title": title_match.group(1).strip() if title_match else None,
+        "core_insight": insight_match.group(1).strip() if insight_match else None,
+    }
+
+
+def take_bullet_snippets(text: str, limit: int = 3) -> List[str]:
+    """First few bullet lines of a theme file, for digest sections"""
+    snippets: List[str] = []
+    for line in text.splitlines():
+        match = _BULLET_RE.match(line)
+        if match:
+            snippets.append(match.group(1).strip())
+            if len(snippets) >= limit:
+                break
+    return snippets
+
+
+# ---------------------------------------------------------------------------
+# Gather steps
+# ---------------------------------------------------------------------------
+
+def _index_dir(step_dir: Path) -> Dict[str, List[os.DirEntry]]:
+    """Bin a step directory's files by role in a single scandir pass.
+
+    Replaces one glob() walk per filename pattern; DirEntry objects carry
+    cached stat results so newest-file selection needs no extra syscalls.
+    """
+    bins: Dict[str, List[os.DirEntry]] = {}
+    with os.scandir(step_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("master_codebook_") and name.endswith(".md"):
+                bins.setdefault("master", []).append(entry)
+            elif name.startswith("all_insights_") and name.endswith(".json"):
+                bins.setdefault("insights", []).append(entry)
+            elif name.startswith("theme_cluster_") and name.endswith(".md"):
+                bins.setdefault("clusters", []).append(entry)
+            elif name.startswith("synthesis_") and name.endswith(".md"):
+                bins.setdefault("synthesis", []).append(entry)
+            elif name.startswith("insights_") and name.endswith(".md"):
+                bins.setdefault("sections", []).append(entry)
+            else:
+                bins.setdefault("other", []).append(entry)
+    return bins
+
+
+def _newest(entries: List[os.DirEntry]) -> Optional[Path]:
+    """Newest entry by the DirEntry's cached mtime, in one pass"""
+    latest: Optional[os.DirEntry] = None
+    latest_mtime = -1.0
+    for entry in entries:
+        mtime = entry.stat().st_mtime
+        if mtime > latest_mtime:
+            latest_mtime = mtime
+            latest = entry
+    return Path(latest.path) if latest is not None else None
+
+
+def gather_step5_assets(
+    workflow_dir: Path,
+    canonical_sections: List[str],
+    needs: Optional[set] = None,
+) -> Dict[str, Any]:
+    """Collect the insight synthesis, insight report and per-section insights.
+
+    `needs` is the set of sources the chosen template actually references;
+    the per-section read loop is skipped entirely when no section source is
+    requested. None means gather everything.
+    """
+    step_dir = workflow_dir / "step5_insights"
+    data: Dict[str, Any] = {"warnings": [], "section_insights": {}}
+    if not step_dir.is_dir():
+        data["warnings"].append("step5_insights directory missing")
+        return data
+
+    index = _index_dir(step_dir)
+    synthesis_path = _newest(index.get("synthesis", []))
+    if synthesis_path is not None:
+        data["synthesis"] = {
+            "path": synthesis_path,
+            "text": strip_heading_block(_read_text_fast(synthesis_path)),
+        }
+    else:
+        data["warnings"].append("No synthesis found in step5_insights")
+
+    other_names = {e.name for e in index.get("other", [])}
+    if "insight_extraction_report.md" in other_names:
+        report_path = step_dir / "insight_extraction_report.md"
+        data["insight_report"] = {
+            "path": report_path,
+            "text": strip_heading_block(_read_text_fast(report_path)),
+        }
+
+    insights_path = _newest(index.get("insights", []))
+    if insights_path is not None:
+        with open(insights_path, "r", encoding="utf-8") as f:
+            data["all_insights"] = json.load(f)
+
+    if needs is not None and not any(
+        src and src.startswith("step5.section_insights.") for src in needs
+    ):
+        return data
+
+    # O(1) filename lookups instead of one exists() stat per section
+    section_lookup = {
+        f"insights_{s.replace(' ', '_').lower()}.md": s for s in canonical_sections
+    }
+    found: Dict[str, Path] = {}
+    for entry in index.get("sections", []):
+        section = section_lookup.get(entry.name)
+        if section is not None:
+            found[section] = Path(entry.path)
+    # Read the per-section files concurrently; parsing stays in order
+    to_read = [(s, found[s]) for s in canonical_sections if s in found]
+    if to_read:
+        with ThreadPoolExecutor(max_workers=min(8, len(to_read))) as pool:
+            raws = list(pool.map(lambda item: _read_text_fast(item[1]), to_read))
+        for (section, path), raw in zip(to_read, raws):
+            data["section_insights"][normalize_section_key(section)] = {
+                "title": section,
+                "path": path,
+                "text": strip_heading_block(raw),
+            }
+    for section in canonical_sections:
+        if section not in found:
+            data["warnings"].append(f"Section insights missing: {section}")
+    return data
+
+
+def gather_step6_assets(workflow_dir: Path) -> Dict[str, Any]:
+    """Collect the master codebook, enriched report and theme cluster files"""
+    step_dir = workflow_dir / "step6_themes"
+    data: Dict[str, Any] = {"warnings": [], "themes": []}
+    if not step_dir.is_dir():
+        data["warnings"].append("step6_themes directory missing")
+        return data
+
+    index = _index_dir(step_dir)
+    codebook_path = _newest(index.get("master", []))
+    if codebook_path is not None:
+        # One read, with the stripped body and excerpt derived once here;
+        # render-time resolution reuses these instead of re-stripping
+        master_text = _read_text_fast(codebook_path)
+        cleaned_full = strip_heading_block(master_text)
+        data["master_codebook"] = {
+            "path": codebook_path,
+            "text": master_text,
+            "cleaned": cleaned_full,
+            "excerpt": truncate_markdown(cleaned_full, 220),
+        }
+    else:
+        data["warnings"].append("No master codebook found in step6_themes")
+
+    if "enriched_themes_report.md" in {e.name for e in index.get("other", [])}:
+        enriched_path = step_dir / "enriched_themes_report.md"
+        data["enriched_report"] = {
+            "path": enriched_path,
+            "text": strip_heading_block(_read_text_fast(enriched_path)),
+        }
+
+    # Read theme cluster files concurrently; parsing stays in name order
+    paths = [Path(e.path) for e in sorted(index.get("clusters", []), key=lambda e: e.name)]
+    if paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            raws = list(pool.map(_read_text_fast, paths))
+        for path, raw in zip(paths, raws):
+            meta = extract_theme_metadata(raw)
+            data["themes"].append({
+                "path": path,
+                "title": meta["title"] or path.stem,
+                "core_insight": meta["core_insight"],
+                "snippets": take_bullet_snippets(raw),
+                "text": strip_heading_block(raw),
+            })
+    return data
+
+
+def gather_step7_assets(workflow_dir: Path, needs: Optional[set] = None) -> Dict[str, Any]:
+    """Collect visualization images and the brand playbook derivatives.
+
+    The playbook CSV parse and its two sorts only run when the template
+    references the bullets or social snippet; None means gather everything.
+    """
+    step_dir = workflow_dir / "step7_visualizations"
+    data: Dict[str, Any] = {"warnings": [], "visuals": {}}
+    if not step_dir.is_dir():
+        data["warnings"].append("step7_visualizations directory missing")
+        return data
+
+    with os.scandir(step_dir) as it:
+        names = {e.name for e in it}
+    for name in ("semiotic_atlas", "theme_network", "territory_map"):
+        if f"{name}.png" in names:
+            data["visuals"][name] = step_dir / f"{name}.png"
+        else:
+            data["warnings"].append(f"Visualization missing: {name}.png")
+
+    if needs is not None and not (
+        {"step7.playbook_bullets", "step7.social_snippet"} & needs
+    ):
+        return data
+
+    if "brand_playbook.csv" in names:
+        df = load_playbook_dataframe(step_dir / "brand_playbook.csv")
+        data["playbook_bullets"] = build_playbook_bullets(df)
+        data["social_snippet"] = build_social_snippet(df)
+    else:
+        data["warnings"].append("brand_playbook.csv missing")
+    return data
+
+
+# ---------------------------------------------------------------------------
+# Playbook dataframe helpers
+# ---------------------------------------------------------------------------
+
+# Below this size pandas wins: pyarrow's fixed startup cost dominates
+_PYARROW_MIN_BYTES = 1 << 20
+
+
+def load_playbook_dataframe(path: Path) -> "pd.DataFrame":
+    """Load the brand playbook CSV produced by the playbook builder.
+
+    Uses pyarrow's multithreaded CSV reader when installed and the file is
+    big enough to amortize its startup cost; falls back to pandas.
+    """
+    if _pacsv is not None and path.stat().st_size >= _PYARROW_MIN_BYTES:
+        return _pacsv.read_csv(str(path)).to_pandas()
+    return pd.read_csv(path)
+
+
+def build_playbook_bullets(df: "pd.DataFrame", max_items: int = 5) -> str:
+    """Markdown bullets for each playbook quadrant, strongest first.
+
+    The display columns and the bullet string itself are built with
+    vectorized column operations; the only Python-level loop left is one
+    iteration per quadrant.
+    """
+    df = df[df["quadrant"].isin(QUADRANT_ORDER)].copy()
+    if df.empty:
+        return ""
+
+    # Fixed two-decimal display strings in one C-level pass per column
+    adoption = pd.to_numeric(df["adoption"], errors="coerce").to_numpy(dtype="float64")
+    distinct = pd.to_numeric(df["distinctiveness"], errors="coerce").to_numpy(dtype="float64")
+    df["_adoption_txt"] = np.where(np.isnan(adoption), "n/a", np.char.mod("%.2f", adoption))
+    df["_distinct_txt"] = np.where(np.isnan(distinct), "n/a", np.char.mod("%.2f", distinct))
+
+    if "example_sentence" in df:
+        example = df["example_sentence"].fillna("").astype(str)
+        example = example.where(example.str.len() <= 140,
+                                example.str.slice(0, 137).str.rstrip() + "…")
+    else:
+        example = pd.Series("", index=df.index)
+    section = (df["section"].fillna("?").astype(str) if "section" in df
+               else pd.Series("?", index=df.index))
+
+    df["_bullet"] = ("- **" + df["phrase"].astype(str) + "** (" + section
+                     + ") — adoption " + df["_adoption_txt"] + ", distinctiveness "
+                     + df["_distinct_txt"] + ". " + example)
+
+    df = df.sort_values("distinctiveness", ascending=False)
+    lines: List[str] = []
+    for quadrant in QUADRANT_ORDER:
+        bullets = df.loc[df["quadrant"] == quadrant, "_bullet"].head(max_items)
+        if bullets.empty:
+            continue
+        lines.append(f"**{quadrant}**")
+        lines.extend(bullets.tolist())
+        lines.append("")
+    return "\n".join(lines).strip()
+
+
+def build_social_snippet(df: "pd.DataFrame", top_n: int = 3) -> str:
+    """One-line social copy built from the highest-adoption phrases"""
+    phrases = (df.sort_values("adoption", ascending=False)["phrase"]
+               .dropna().astype(str).head(top_n))
+    if phrases.empty:
+        return ""
+    return "Lead with " + " · ".join("「" + p + "」" for p in phrases) + " in social copy."
+
+
+# ---------------------------------------------------------------------------
+# Template resolution
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class ResolvedAsset:
+    """A template asset resolved against the gathered step payloads"""
+    name: str
+    source: str
+    path: Optional[Path] = None
+    text: Optional[str] = None
+    missing: bool = False
+    notes: List[str] = field(default_factory=list)
+
+
+def build_assets(
+    template_def: Dict[str, Any],
+    step5: Dict[str, Any],
+    step6: Dict[str, Any],
+    step7: Dict[str, Any],
+) -> Dict[str, ResolvedAsset]:
+    """Resolve the template's declared assets to concrete files/text"""
+    assets: Dict[str, ResolvedAsset] = {}
+    for asset_def in template_def.get("assets", []):
+        name = asset_def["name"]
+        source = asset_def["source"]
+        asset = ResolvedAsset(name=name, source=source)
+        if source.startswith("step7.visual."):
+            key = source.rsplit(".", 1)[-1]
+            path = step7.get("visuals", {}).get(key)
+            if path is not None:
+                asset.path = path
+            else:
+                asset.missing = True
+                asset.notes.append(f"Visual not produced: {key}")
+        elif source == "step6.master_codebook":
+            entry = step6.get("master_codebook")
+            if entry:
+                asset.path = entry["path"]
+                asset.text = entry.get("text")
+            else:
+                asset.missing = True
+                asset.notes.append("Master codebook not found")
+        elif source == "step6.enriched_report":
+            entry = step6.get("enriched_report")
+            if entry:
+                asset.path = entry["path"]
+                asset.text = entry.get("text")
+            else:
+                asset.missing = True
+                asset.notes.append("Enriched themes report not found")
+        else:
+            asset.missing = True
+            asset.notes.append(f"Unknown asset source: {source}")
+        assets[name] = asset
+    return assets
+
+
+def _entry_text(payload: Dict[str, Any], key: str, warning: str):
+    """Shared handler body: return an entry's text or a missing warning"""
+    entry = payload.get(key)
+    if entry is None:
+        return None, warning
+    return entry["text"], None
+
+
+def _resolve_master_codebook(step5, step6, step7, assets, metadata):
+    entry = step6.get("master_codebook")
+    if entry is None:
+        return None, "Master codebook missing."
+    return entry["cleaned"], None
+
+
+def _resolve_master_codebook_excerpt(step5, step6, step7, assets, metadata):
+    entry = step6.get("master_codebook")
+    if entry is None:
+        return None, "Master codebook missing."
+    return entry["excerpt"], None
+
+
+def _resolve_insight_report(step5, step6, step7, assets, metadata):
+    return _entry_text(step5, "insight_report", "Insight extraction report missing.")
+
+
+def _resolve_synthesis(step5, step6, step7, assets, metadata):
+    return _entry_text(step5, "synthesis", "Insight synthesis missing.")
+
+
+def _resolve_enriched_report(step5, step6, step7, assets, metadata):
+    return _entry_text(step6, "enriched_report", "Enriched themes report missing.")
+
+
+def _resolve_theme_digest(step5, step6, step7, assets, metadata):
+    themes = step6.get("themes", [])
+    if not themes:
+        return None, "No theme clusters found."
+    parts: List[str] = []
+    for theme in themes:
+        parts.append(f"**{theme['title']}**")
+        if theme.get("core_insight"):
+            parts.append(f"_{theme['core_insight']}_")
+        for snippet in theme.get("snippets", []):
+            parts.append(f"- {snippet}")
+        parts.append("")
+    return "\n".join(parts).strip(), None
+
+
+def _resolve_playbook_bullets(step5, step6, step7, assets, metadata):
+    text = step7.get("playbook_bullets")
+    if not text:
+        return None, "Brand playbook bullets unavailable."
+    return text, None
+
+
+def _resolve_social_snippet(step5, step6, step7, assets, metadata):
+    text = step7.get("social_snippet")
+    if not text:
+        return None, "Social snippet unavailable."
+    return text, None
+
+
+# O(1) dispatch for exact-match sources; the prefixed forms (literal:,
+# metadata., step5.section_insights.) are handled before the lookup
+_SOURCE_HANDLERS = {
+    "step6.master_codebook": _resolve_master_codebook,
+    "step6.master_codebook_excerpt": _resolve_master_codebook_excerpt,
+    "step5.insight_report": _resolve_insight_report,
+    "step5.synthesis": _resolve_synthesis,
+    "step6.enriched_report": _resolve_enriched_report,
+    "step6.theme_digest": _resolve_theme_digest,
+    "step7.playbook_bullets": _resolve_playbook_bullets,
+    "step7.social_snippet": _resolve_social_snippet,
+}
+
+
+def resolve_text_source(
+    source: str,
+    step5: Dict[str, Any],
+    step6: Dict[str, Any],
+    step7: Dict[str, Any],
+    assets: Dict[str, ResolvedAsset],
+    metadata: Dict[str, Any],
+) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve a section source string to text; returns (text, warning)"""
+    if source.startswith("literal:"):
+        return source[len("literal:"):], None
+    if source.startswith("metadata."):
+        key = source.split(".", 1)[1]
+        value = metadata.get(key)
+        if value is None:
+            return None, f"Metadata field missing: {key}"
+        return str(value), None
+    if source.startswith("step5.section_insights."):
+        key = source.rsplit(".", 1)[-1]
+        entry = step5.get("section_insights", {}).get(key)
+        if entry is None:
+            return None, f"Section insights missing: {key}"
+        return entry["text"], None
+    handler = _SOURCE_HANDLERS.get(source)
+    if handler is not None:
+        return handler(step5, step6, step7, assets, metadata)
+    return None, f"Unknown section source: {source}"
+
+
+def build_sections(
+    template_def: Dict[str, Any],
+    step5: Dict[str, Any],
+    step6: Dict[str, Any],
+    step7: Dict[str, Any],
+    assets: Dict[str, ResolvedAsset],
+    metadata: Dict[str, Any],
+) -> Tuple[Dict[str, Dict[str, str]], List[str]]:
+    """Resolve every template section; returns (sections, warnings)"""
+    sections: Dict[str, Dict[str, str]] = {}
+    warnings: List[str] = []
+    for section_def in template_def.get("sections", []):
+        text, warning = resolve_text_source(
+            section_def["source"], step5, step6, step7, assets, metadata
+        )
+        if warning:
+            warnings.append(f"{section_def['key']}: {warning}")
+        if text:
+            sections[section_def["key"]] = {
+                "title": section_def.get("title", section_def["key"]),
+                "text": text,
+            }
+    return sections, warnings
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=8)
+def _get_env(template_dir: str) -> Environment:
+    """Jinja environment per template directory, built once per process.
+
+    auto_reload is off and a filesystem bytecode cache is enabled so batch
+    runs (and repeat invocations) skip template lexing/parsing/codegen.
+    """
+    bc_dir = Path(tempfile.gettempdir()) / "xhs_jinja_cache"
+    bc_dir.mkdir(exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        autoescape=False,
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=FileSystemBytecodeCache(directory=str(bc_dir)),
+    )
+
+
+def render_template(
+    template_path: Path,
+    context: Dict[str, Any],
+    output_dir: Path,
+    deliverable: str = "md",
+) -> List[Path]:
+    """Render the report template to markdown and optionally DOCX via pandoc"""
+    template = _get_env(str(template_path.parent)).get_template(template_path.name)
+
+    written: List[Path] = []
+    md_path = output_dir / "report.md"
+    if deliverable != "docx":
+        # Stream fragments straight to disk; the full report (which embeds
+        # the master codebook and every theme) is never assembled in memory
+        template.stream(**context).dump(str(md_path), encoding="utf-8")
+        written.append(md_path)
+
+    if deliverable in ("docx", "both"):
+        docx_path = output_dir / "report.docx"
+        try:
+            if deliverable == "docx":
+                # Stream the render straight into pandoc's stdin: no
+                # intermediate markdown file is written or re-read
+                proc = subprocess.Popen(
+                    ["pandoc", "-f", "markdown", "-o", str(docx_path)],
+                    stdin=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+                for chunk in template.generate(**context):
+                    proc.stdin.write(chunk.encode("utf-8"))
+                proc.stdin.close()
+                stderr = proc.stderr.read()
+                if proc.wait() != 0:
+                    raise subprocess.CalledProcessError(
+                        proc.returncode, "pandoc", stderr=stderr
+                    )
+            else:
+                subprocess.run(
+                    ["pandoc", str(md_path), "-o", str(docx_path)],
+                    check=True,
+                    stderr=subprocess.PIPE,
+                )
+            written.append(docx_path)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            print(f"Warning: pandoc conversion failed ({exc}); writing markdown instead")
+            if md_path not in written:
+                template.stream(**context).dump(str(md_path), encoding="utf-8")
+                written.append(md_path)
+    return written
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """Hardlink src into the bundle, falling back to a full copy.
+
+    The bundle lives under the workflow dir, so src and dest are almost
+    always on the same filesystem and os.link is an O(1) metadata op —
+    no bytes move even for multi-MB atlas PNGs. Cross-device or
+    unsupported filesystems fall back to shutil.copy2.
+    """
+    if dest.exists():
+        dest.unlink()
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+def copy_assets_to_bundle(
+    assets: Dict[str, ResolvedAsset], bundle_dir: Path
+) -> List[Path]:
+    """Copy resolved file assets into the bundle's assets/ folder"""
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    copied: List[Path] = []
+    for asset in assets.values():
+        if asset.missing or asset.path is None:
+            continue
+        dest = bundle_dir / asset.path.name
+        _link_or_copy(asset.path, dest)
+        copied.append(dest)
+    return copied
+
+
+def write_metadata_file(meta_path: Path, export: Dict[str, Any]) -> None:
+    """Write the report metadata/manifest JSON"""
+    if orjson is not None:
+        meta_path.write_bytes(
+            orjson.dumps(export, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    # Stream into the file handle rather than materializing the whole JSON
+    # string first; halves peak memory for manifest-heavy reports
+    with meta_path.open("w", encoding="utf-8", buffering=1 << 16) as fp:
+        json.dump(export, fp, indent=2, ensure_ascii=False)
+
+
+# Already-compressed formats gain nothing from deflate; store them as-is
+_STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".zip"}
+
+
+def zip_bundle(output_dir: Path, zip_path: Path) -> Path:
+    """Zip the rendered bundle for hand-off.
+
+    Text assets (markdown/CSV/JSON) deflate to a fraction of their size;
+    image formats are stored uncompressed to skip pointless CPU.
+    """
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED,
+                         compresslevel=6) as zf:
+        for file in sorted(output_dir.rglob("*")):
+            if file.is_file() and file != zip_path:
+                ct = (zipfile.ZIP_STORED if file.suffix.lower() in _STORED_SUFFIXES
+                      else zipfile.ZIP_DEFLATED)
+                zf.write(file, file.relative_to(output_dir), compress_type=ct)
+    return zip_path
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+# Memoized config accessors so batch drivers looping over main() (multiple
+# templates or workflows) parse pipeline_config.json once per process
+@functools.lru_cache(maxsize=1)
+def _cached_config():
+    return get_config()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_template(key: str) -> Dict[str, Any]:
+    return _cached_config().get_report_template(key)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_sections() -> Tuple[str, ...]:
+    return tuple(_cached_config().get_canonical_sections())
+
+
+def main():
+    """Main CLI interface"""
+    parser = argparse.ArgumentParser(description="Generate a client report bundle")
+    parser.add_argument("workflow", help="Workflow directory (contains step5/6/7 outputs)")
+    parser.add_argument("-t", "--template", default="full",
+                        help="Report template name from pipeline_config.json")
+    parser.add_argument("-d", "--deliverable", choices=("md", "docx", "both"), default=None,
+                        help="Output format (defaults to the template's setting)")
+    parser.add_argument("--zip", action="store_true", help="Also zip the bundle")
+    args = parser.parse_args()
+
+    workflow_dir = Path(args.workflow)
+    if not workflow_dir.is_dir():
+        print(f"Error: workflow directory not found: {workflow_dir}")
+        sys.exit(1)
+
+    template_def = _cached_template(args.template)
+    canonical_sections = list(_cached_sections())
+    deliverable = args.deliverable or template_def.get("deliverable", "md")
+
+    # Sources the template actually references; gathers skip dead work
+    needs = ({s.get("source") for s in template_def.get("sections", [])}
+             | {a.get("source") for a in template_def.get("assets", [])})
+
+    # The three gathers touch disjoint directories and share no state, so
+    # run them concurrently; wall time becomes max() instead of sum().
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        f5 = pool.submit(gather_step5_assets, workflow_dir, canonical_sections, needs)
+        f6 = pool.submit(gather_step6_assets, workflow_dir)
+        f7 = pool.submit(gather_step7_assets, workflow_dir, needs)
+        step5, step6, step7 = f5.result(), f6.result(), f7.result()
+
+    metadata = {
+        "title": template_def.get("title", "Market Research Report"),
+        "workflow": workflow_dir.name,
+        "template": args.template,
+        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
+    }
+
+    assets = build_assets(template_def, step5, step6, step7)
+    sections, section_warnings = build_sections(
+        template_def, step5, step6, step7, assets, metadata
+    )
+    warnings = (step5["warnings"] + step6["warnings"] + step7["warnings"]
+                + section_warnings)
+
+    output_dir = workflow_dir / "report_bundle" / args.template
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    template_path = Path(__file__).resolve().parent.parent / template_def["template_path"]
+    context = {"metadata": metadata, "sections": sections, "assets": assets}
+    written = render_template(template_path, context, output_dir, deliverable)
+    copied = copy_assets_to_bundle(assets, output_dir / "assets")
+
+    export = {
+        "metadata": metadata,
+        "sections": list(sections.keys()),
+        "assets": {name: str(a.path) if a.path else None for name, a in assets.items()},
+        "warnings": warnings,
+        "files": [str(p) for p in written + copied],
+    }
+    write_metadata_file(output_dir / "report_metadata.json", export)
+
+    if args.zip:
+        zip_path = zip_bundle(output_dir, output_dir / f"{args.template}_bundle.zip")
+        print(f"Bundle zipped: {zip_path}")
+
+    for warning in warnings:
+        print(f"Warning: {warning}")
+    print(f"Report written to {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Pipeline configuration loader
+Wraps pipeline_config.json with typed accessors for scraper settings,
+canonical report sections and report template definitions. Secrets stay
+in .env; this file only carries non-sensitive settings.
+"""
+
+import fnmatch
+import json
+import os
+import string
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CONFIG_PATH = Path(__file__).parent / "pipeline_config.json"
+
+
+# API-config keys that environment variables (via .env) may override
+_ENV_MAP = {
+    "apify_api_token": "APIFY_API_TOKEN",
+    "apify_actor_id": "APIFY_ACTOR_ID",
+    "openai_api_key": "OPENAI_API_KEY",
+    "deepseek_api_key": "DEEPSEEK_API_KEY",
+}
+
+
+@dataclass(slots=True)
+class ApiConfig:
+    """Typed view over api_config; attribute loads are C slot lookups"""
+    apify_api_token: str = ""
+    apify_actor_id: str = "watk8sVZNzd40UtbQ"
+    openai_api_key: str = ""
+    openai_model: str = "gpt-4o-mini"
+    deepseek_api_key: str = ""
+
+
+@dataclass(slots=True)
+class PipelineSettings:
+    """Typed view over pipeline_settings with the documented defaults"""
+    default_output_dir: str = "data"
+    default_max_items: int = 30
+    default_max_downloads: int = 50
+    request_delay: float = 0.5
+    max_retries: int = 3
+    timeout: int = 10
+    rate_limit_delay: float = 2
+
+
+def _build_view(view_cls, raw: Dict[str, Any]):
+    known = {f.name for f in fields(view_cls)}
+    return view_cls(**{k: v for k, v in raw.items() if k in known})
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime); repeat loads share the dict.
+
+    The mtime key makes edits visible after a stat() without re-parsing
+    on every construction; save() clears the cache explicitly.
+    """
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+class PipelineConfig:
+    """Typed accessor over pipeline_config.json"""
+
+    __slots__ = ("config_path", "_config", "_compiled", "_api", "_settings",
+                 "_batch_depth", "_dirty")
+
+    def __init__(self, config_path: Path = CONFIG_PATH):
+        self.config_path = Path(config_path)
+        # Parsing is deferred to the first .config access, so constructing
+        # an instance never touches the filesystem
+        self._config: Optional[Dict[str, Any]] = None
+        # Prompt templates pre-parsed into (literal, field) runs on first use
+        self._compiled: Dict[Tuple[str, str], List[Tuple[str, Optional[str]]]] = {}
+        self._api: Optional[ApiConfig] = None
+        self._settings: Optional[PipelineSettings] = None
+        self._batch_depth = 0
+        self._dirty = False
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Parsed configuration, loaded lazily on first access.
+
+        Candidate paths are tried EAFP-style — one stat each, no
+        exists() pre-checks; the stat result doubles as the cache key
+        for the shared mtime-keyed parse.
+        """
+        if self._config is None:
+            for path in (self.config_path, CONFIG_PATH):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                self._config = _load_config_cached(str(path.resolve()),
+                                                   stat.st_mtime_ns)
+                break
+            else:
+                self._config = {}
+        return self._config
+
+    @property
+    def settings(self) -> PipelineSettings:
+        """Slotted pipeline_settings view, built once on first use"""
+        if self._settings is None:
+            self._settings = _build_view(PipelineSettings,
+                                         self.config.get("pipeline_settings", {}))
+        return self._settings
+
+    @property
+    def api(self) -> ApiConfig:
+        """Slotted api_config view, built once on first use"""
+        if self._api is None:
+            self._api = _build_view(ApiConfig, self.config.get("api_config", {}))
+        return self._api
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a value from pipeline_settings.
+
+        Known keys resolve as slot loads on the typed view; extra keys
+        (callers can stash their own settings) fall back to the dict.
+        """
+        settings = self.settings
+        if hasattr(settings, key):
+            return getattr(settings, key)
+        return self.config.get("pipeline_settings", {}).get(key, default)
+
+    def get_api_config(self, key: str, default: Any = None) -> Any:
+        """Read a value from api_config; environment variables win.
+
+        Overrides are resolved here at read time instead of copied into
+        the (shared, cached) config dict at construction, so env changes
+        are picked up live and construction does no env lookups.
+        """
+        env_var = _ENV_MAP.get(key)
+        if env_var:
+            value = os.environ.get(env_var)
+            if value:
+                return value
+        api = self.api
+        if hasattr(api, key):
+            return getattr(api, key)
+        return self.config.get("api_config", {}).get(key, default)
+
+    def get_prompt(self, step: str, prompt_name: str, **kwargs: Any) -> str:
+        """Fetch a prompt template for a pipeline step, filling placeholders.
+
+        Templates are parsed once into (literal, field) runs via
+        string.Formatter; rendering the same prompt across thousands of
+        posts is then a join over looked-up kwargs instead of a full
+        str.format parse per call.
+        """
+        key = (step, prompt_name)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            prompt = self.config.get("prompts", {}).get(step, {}).get(prompt_name, "")
+            compiled = [(literal, field)
+                        for literal, field, _, _ in string.Formatter().parse(prompt)]
+            self._compiled[key] = compiled
+        if not kwargs:
+            return "".join(
+                literal + (f"{{{field}}}" if field is not None else "")
+                for literal, field in compiled
+            )
+        return "".join(
+            literal + (str(kwargs[field]) if field is not None else "")
+            for literal, field in compiled
+        )
+
+    def get_all_prompts_for_step(self, step: str) -> Dict[str, str]:
+        """All prompt templates registered for a pipeline step"""
+        return dict(self.config.get("prompts", {}).get(step, {}))
+
+    def update_prompt(self, step: str, prompt_name: str, new_prompt: str) -> None:
+        """Replace a prompt template and persist the config
+
+        Unchanged prompts are a no-op; inside batch_update() the disk
+        write is deferred until the block exits.
+        """
+        step_prompts = self.config.setdefault("prompts", {}).setdefault(step, {})
+        if step_prompts.get(prompt_name) == new_prompt:
+            return
+        step_prompts[prompt_name] = new_prompt
+        self._compiled.pop((step, prompt_name), None)
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.save()
+
+    @contextmanager
+    def batch_update(self):
+        """Group several update_prompt calls into a single save.
+
+        Nested blocks are allowed; the config is written once, when the
+        outermost block exits, and only if something actually changed.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self.save()
+
+    def save(self) -> None:
+        """Write the current configuration back to disk"""
+        if orjson is not None:
+            self.config_path.write_bytes(orjson.dumps(
+                self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            with open(self.config_path, "w", encoding="utf-8") as f:
+                json.dump(self.config, f, indent=2, ensure_ascii=False)
+        _load_config_cached.cache_clear()
+
+    def print_prompts_summary(self) -> None:
+        """One-line-per-prompt overview of the configured templates"""
+        for step, prompts in self.config.get("prompts", {}).items():
+            print(f"{step}:")
+            for name, prompt in prompts.items():
+                first_line = prompt.strip().splitlines()[0] if prompt.strip() else ""
+                print(f"  - {name}: {first_line[:70]}")
+
+    def export_prompts_to_markdown(self, output_path: str = "PROMPTS_REFERENCE.md") -> Path:
+        """Write every prompt template to a markdown reference file"""
+        parts = ["# Pipeline Prompts Reference\n"]
+        for step, prompts in self.config.get("prompts", {}).items():
+            parts.append(f"\n## {step}\n")
+            for name, prompt in prompts.items():
+                parts.append(f"\n### {name}\n\n```\n{prompt.strip()}\n```\n")
+        out = Path(output_path)
+        out.write_text("".join(parts), encoding="utf-8")
+        return out
+
+    def get_canonical_sections(self) -> List[str]:
+        """Ordered list of canonical report section names"""
+        return self.config.get("report", {}).get("canonical_sections", [])
+
+    def get_report_template(self, key: str) -> Dict[str, Any]:
+        """Look up a report template definition by name"""
+        templates = self.config.get("report", {}).get("templates", {})
+        if key not in templates:
+            known = ", ".join(sorted(templates)) or "none"
+            raise KeyError(f"Unknown report template: {key} (known: {known})")
+        return templates[key]
+
+    def get_report_template_names(self) -> List[str]:
+        return sorted(self.config.get("report", {}).get("templates", {}))
+
+
+# Ordered workflow step names; each maps to a subdirectory of the query dir
+WORKFLOW_STEPS = (
+    "step1_scraped",
+    "step2_media",
+    "step3_transcripts",
+    "step4_descriptions",
+    "step5_insights",
+    "step6_themes",
+    "step7_visualizations",
+    "final_reports",
+    "final_deliverables",
+)
+
+
+class WorkflowConfig:
+    """Per-query workflow state: step directory layout plus run metadata.
+
+    Step directories are created lazily on first get_dir() rather than
+    up front in set_query, so a single-step run costs one mkdir instead
+    of nine.
+    """
+
+    def __init__(self, base_dir: Optional[Path] = None):
+        self.base_dir = Path(base_dir) if base_dir else Path("data")
+        self.query: Optional[str] = None
+        self.query_dir: Optional[Path] = None
+        self.dirs: Dict[str, Path] = {}
+
+    def set_query(self, query: str, date_override: Optional[str] = None) -> Path:
+        """Point the workflow at a query (same layout as the scraper CLI)"""
+        from datetime import datetime
+
+        clean_query = "".join(
+            c for c in query if c.isalnum() or c in (" ", "-", "_")
+        ).strip().replace(" ", "_")[:50]
+        date_dir = date_override or datetime.now().strftime("%Y%m%d")
+        self.query = query
+        self.query_dir = self.base_dir / date_dir / clean_query
+        self.dirs = {step: self.query_dir / step for step in WORKFLOW_STEPS}
+        return self.query_dir
+
+    def get_dir(self, step: str) -> Path:
+        """Resolve (and lazily create) the directory for a workflow step"""
+        if self.query_dir is None:
+            raise ValueError("set_query() must be called before get_dir()")
+        path = self.dirs.get(step, self.query_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def get_latest_file(self, step: str, pattern: str = "*") -> Optional[Path]:
+        """Newest file matching pattern in a step directory (or None).
+
+        Uses os.scandir so each entry's type and mtime come from the
+        directory read itself instead of a separate stat() per Path.
+        """
+        step_dir = self.dirs.get(step, self.query_dir)
+        if step_dir is None:
+            return None
+        try:
+            with os.scandir(step_dir) as it:
+                entries = [e for e in it
+                           if fnmatch.fnmatch(e.name, pattern) and e.is_file()]
+        except FileNotFoundError:
+            return None
+        if not entries:
+            return None
+        return Path(max(entries, key=lambda e: e.stat().st_mtime).path)
+
+    def save_config(self, extra: Optional[Dict[str, Any]] = None) -> Path:
+        """Persist the workflow state next to the query outputs"""
+        from datetime import datetime
+
+        if self.query_dir is None:
+            raise ValueError("set_query() must be called before save_config()")
+        config_data: Dict[str, Any] = {
+            "query": self.query,
+            "query_dir": str(self.query_dir),
+            "dirs": {step: str(path) for step, path in self.dirs.items()},
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        if extra:
+            config_data.update(extra)
+        self.query_dir.mkdir(parents=True, exist_ok=True)
+        config_file = self.query_dir / "workflow_config.json"
+        if orjson is not None:
+            config_file.write_bytes(orjson.dumps(
+                config_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(config_file, "w", encoding="utf-8") as f:
+                json.dump(config_data, f, indent=2, ensure_ascii=False)
+        return config_file
+
+    def load_config(self, config_path: Path) -> Dict[str, Any]:
+        """Restore workflow state from a saved workflow_config.json"""
+        raw = Path(config_path).read_bytes()
+        config_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        self.query = config_data.get("query")
+        query_dir = config_data.get("query_dir")
+        self.query_dir = Path(query_dir) if query_dir else None
+        self.dirs = {step: Path(p) for step, p in config_data.get("dirs", {}).items()}
+        return config_data
+
+
+@lru_cache(maxsize=8)
+def _get_config_cached(path_str: str) -> PipelineConfig:
+    return PipelineConfig(Path(path_str))
+
+
+def get_config(config_path: Optional[Path] = None) -> PipelineConfig:
+    """Load the pipeline configuration (memoized per path)"""
+    return _get_config_cached(str(config_path or CONFIG_PATH))
+
+
+def test_config() -> None:
+    """Quick smoke check of the configuration file"""
+    config = get_config()
+    print(f"Config: {config.config_path}")
+    print(f"Pipeline settings: {len(config.config.get('pipeline_settings', {}))} keys")
+    print(f"Report templates: {', '.join(config.get_report_template_names()) or 'none'}")
+    config.print_prompts_summary()
+    if os.getenv("EXPORT_PROMPTS"):
+        print(f"Exported prompts to {config.export_prompts_to_markdown()}")
+
+
+if __name__ == "__main__":
+    test_config()
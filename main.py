@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Scrape Xiaohongshu posts for one keyword and download their media
+Pipeline entry point: runs the Apify actor for the keyword, saves the raw
+results JSON, then downloads each post's images/videos into
+data/downloaded_content/<date>/<keyword>/ ready for analyze.py.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+try:
+    from apify_client import ApifyClient
+    from dotenv import load_dotenv
+    from rich.console import Console
+    from rich.table import Table
+except ImportError:
+    print("Error: Scraper dependencies not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from config_loader import get_config
+from utils.media_downloader import XHSMediaDownloader
+
+load_dotenv()
+console = Console()
+
+
+def _dump_json(path: Path, data) -> None:
+    """Write results JSON (orjson when available, stdlib fallback)"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def _stream_dataset_to_json(dataset, path: Path):
+    """Write dataset items to an on-disk JSON array as they are iterated.
+
+    Each item is encoded and appended individually, so the serialized
+    results never exist as one big in-memory string; the parsed items are
+    still returned for the download step.
+    """
+    results = []
+    with open(path, "wb") as f:
+        f.write(b"[")
+        first = True
+        for item in dataset.iterate_items():
+            if not first:
+                f.write(b",\n")
+            first = False
+            if orjson is not None:
+                f.write(orjson.dumps(item))
+            else:
+                f.write(json.dumps(item, ensure_ascii=False).encode("utf-8"))
+            results.append(item)
+        f.write(b"]")
+    return results
+
+
+CACHE_MAX_AGE = 24 * 3600  # seconds before a cached actor run goes stale
+
+
+def _cache_file(actor_id: str, keyword: str, max_items: int, date_dir: str) -> Path:
+    """Cache path for one (actor, keyword, max_items, date) combination"""
+    key = hashlib.blake2b(
+        f"{actor_id}|{keyword}|{max_items}|{date_dir}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    base = Path(get_config().get("default_output_dir", "data")) / ".apify_cache"
+    return base / f"{key}.json"
+
+
+def _load_cached_results(cache_path: Path):
+    """Return cached results if fresh (<24h) and parseable, else None.
+
+    A truncated entry (e.g. from an interrupted run) is treated as a
+    miss rather than crashing every subsequent same-day scrape.
+    """
+    try:
+        if time.time() - cache_path.stat().st_mtime > CACHE_MAX_AGE:
+            return None
+        data = cache_path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_path: Path, payload: bytes) -> None:
+    """Publish a cache entry atomically (temp file + rename)"""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, cache_path)
+
+
+def make_apify_client(token: str) -> "ApifyClient":
+    """Build the shared Apify client with retry settings applied once"""
+    return ApifyClient(token, max_retries=3, min_delay_between_retries_millis=500)
+
+
+def scrape_xiaohongshu_posts(keyword: str, max_items: int = 30, use_cache: bool = True,
+                             client: "ApifyClient" = None):
+    """Run the Apify actor for one keyword and return the scraped posts
+
+    Identical (keyword, max_items) requests within the same day reuse the
+    cached actor output instead of paying for another run. Callers making
+    several requests can pass a shared client to reuse its HTTP session.
+    """
+    config = get_config()
+    token = config.get_api_config("apify_api_token")
+    if not token:
+        console.print("[red]Error: Apify API token not configured[/red]")
+        console.print("Set APIFY_API_TOKEN in .env")
+        sys.exit(1)
+
+    actor_id = config.get_api_config("apify_actor_id")
+    date_dir = datetime.now().strftime("%Y%m%d")
+    out_dir = Path(config.get("default_output_dir", "data")) / "downloaded_content" / date_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    raw_results_file = out_dir / f"raw_scraper_results_{keyword.replace(' ', '_')}.json"
+
+    cache_path = _cache_file(actor_id, keyword, max_items, date_dir)
+    if use_cache:
+        cached = _load_cached_results(cache_path)
+        if cached is not None:
+            console.print(f"[green]Using cached results for '{keyword}' "
+                          f"({len(cached)} posts)[/green]")
+            _dump_json(raw_results_file, cached)
+            return cached
+
+    client = client or make_apify_client(token)
+    console.print(f"[cyan]Scraping '{keyword}' (max {max_items} items)...[/cyan]")
+    run = client.actor(actor_id).call(run_input={
+        "mode": "search",
+        "keywords": [keyword],
+        "maxItems": max_items,
+    })
+
+    results = _stream_dataset_to_json(client.dataset(run["defaultDatasetId"]),
+                                      raw_results_file)
+    _write_cache(cache_path, raw_results_file.read_bytes())
+
+    console.print(f"[green]Scraped {len(results)} posts -> {raw_results_file}[/green]")
+    return results
+
+
+def download_media_content(results, keyword: str):
+    """Download images/videos for the scraped posts"""
+    config = get_config()
+    downloader = XHSMediaDownloader(
+        request_delay=config.get("request_delay", 0.5),
+        timeout=config.get("timeout", 10),
+        max_retries=config.get("max_retries", 3),
+    )
+    return downloader.download_all_content(results, keyword)
+
+
+def _fmt_text(metadata) -> str:
+    """Short display text for one post (title, falling back to description)"""
+    tc = metadata["text_content"]
+    return (tc.get("title") or tc.get("description") or "")[:40]
+
+
+def display_results_summary(download_results) -> None:
+    """Print a per-post summary table of the download run"""
+    table = Table(title=f"Downloaded {len(download_results)} posts")
+    table.add_column("Post ID")
+    table.add_column("Images", justify="right")
+    table.add_column("Videos", justify="right")
+    table.add_column("Text")
+    table.add_column("Author")
+    table.add_column("Likes", justify="right")
+
+    rows = [
+        (
+            r["post_id"][:18],
+            str(len(r["images_downloaded"])),
+            str(len(r["videos_downloaded"])),
+            _fmt_text(r["metadata"]),
+            r["metadata"]["author"].get("name", "Unknown"),
+            str(r["metadata"]["engagement"].get("likes", 0)),
+        )
+        for r in download_results
+    ]
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def main():
+    """Main CLI interface"""
+    parser = argparse.ArgumentParser(description="Scrape one Xiaohongshu keyword")
+    parser.add_argument("keyword", help="Search keyword")
+    parser.add_argument("-m", "--max-items", type=int, default=None,
+                        help="Maximum posts to scrape")
+    parser.add_argument("--no-download", action="store_true",
+                        help="Skip media downloads, save raw JSON only")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached actor results and re-scrape")
+    args = parser.parse_args()
+
+    config = get_config()
+    max_items = args.max_items or config.get("default_max_items", 30)
+
+    results = scrape_xiaohongshu_posts(args.keyword, max_items,
+                                       use_cache=not args.no_cache)
+    if not results:
+        console.print("[yellow]Found 0 posts[/yellow]")
+        return
+    if not args.no_download:
+        download_results = download_media_content(results, args.keyword)
+        display_results_summary(download_results)
+
+
+if __name__ == "__main__":
+    main()
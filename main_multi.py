@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Scrape Xiaohongshu posts for several keywords in one run
+Runs the Apify actor once per keyword, optionally merges everything into a
+single combined folder, and downloads media into the same
+data/downloaded_content/<date>/ layout analyze_multi.py reads.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from apify_client import ApifyClient
+    from dotenv import load_dotenv
+    from rich.console import Console
+except ImportError:
+    print("Error: Scraper dependencies not installed.")
+    print("Please run: pip install -r requirements.txt")
+    sys.exit(1)
+
+from config_loader import get_config
+from main import (_cache_file, _dump_json, _load_cached_results,
+                  _stream_dataset_to_json, _write_cache, make_apify_client)
+from utils.media_downloader import XHSMediaDownloader
+
+load_dotenv()
+console = Console()
+
+
+def scrape_single_keyword(
+    client: "ApifyClient",
+    keyword: str,
+    max_items: int,
+    out_path: Optional[Path] = None,
+    use_cache: bool = True,
+) -> List[Dict]:
+    """Run the actor for one keyword and collect its dataset items.
+
+    With out_path set, items are streamed straight into the raw-results
+    JSON file as they are iterated rather than serialized in one go.
+    Fresh same-day cache hits skip the actor run entirely.
+    """
+    actor_id = get_config().get_api_config("apify_actor_id")
+    cache_path = _cache_file(actor_id, keyword, max_items,
+                             datetime.now().strftime("%Y%m%d"))
+    if use_cache:
+        cached = _load_cached_results(cache_path)
+        if cached is not None:
+            console.print(f"[green]'{keyword}': {len(cached)} posts (cached)[/green]")
+            if out_path is not None:
+                _dump_json(out_path, cached)
+            return cached
+
+    console.print(f"[cyan]Scraping '{keyword}' (max {max_items} items)...[/cyan]")
+    run = client.actor(actor_id).call(run_input={
+        "mode": "search",
+        "keywords": [keyword],
+        "maxItems": max_items,
+    })
+    dataset = client.dataset(run["defaultDatasetId"])
+    if out_path is not None:
+        results = _stream_dataset_to_json(dataset, out_path)
+        _write_cache(cache_path, out_path.read_bytes())
+    else:
+        results = list(dataset.iterate_items())
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        _dump_json(tmp, results)
+        os.replace(tmp, cache_path)
+    console.print(f"[green]'{keyword}': {len(results)} posts[/green]")
+    return results
+
+
+def scrape_multiple_keywords(
+    keywords: List[str],
+    max_items_per: int = 30,
+    combined_folder: Optional[str] = None,
+    download: bool = True,
+    use_cache: bool = True,
+) -> Dict[str, List[Dict]]:
+    """Scrape every keyword and download media.
+
+    Actor runs are network-bound and independent, so all keywords are
+    scraped concurrently through one shared client instead of serially
+    with a sleep between runs; Apify rate-limits at the account level.
+    """
+    config = get_config()
+    token = config.get_api_config("apify_api_token")
+    if not token:
+        console.print("[red]Error: Apify API token not configured[/red]")
+        console.print("Set APIFY_API_TOKEN in .env")
+        sys.exit(1)
+
+    date_dir = datetime.now().strftime("%Y%m%d")
+    out_dir = Path(config.get("default_output_dir", "data")) / "downloaded_content" / date_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    client = make_apify_client(token)
+    all_results: Dict[str, List[Dict]] = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(keywords))) as pool:
+        futures = {
+            pool.submit(
+                scrape_single_keyword, client, kw, max_items_per,
+                out_dir / f"raw_scraper_results_{kw.replace(' ', '_')}.json",
+                use_cache,
+            ): kw
+            for kw in keywords
+        }
+        for future in as_completed(futures):
+            keyword = futures[future]
+            try:
+                all_results[keyword] = future.result()
+            except Exception as exc:
+                console.print(f"[red]'{keyword}' failed: {exc}[/red]")
+                all_results[keyword] = []
+
+    downloader = XHSMediaDownloader(
+        request_delay=config.get("request_delay", 0.5),
+        timeout=config.get("timeout", 10),
+        max_retries=config.get("max_retries", 3),
+    )
+
+    if combined_folder:
+        combined_results: List[Dict] = []
+        seen_ids: set = set()
+        for keyword, results in all_results.items():
+            for result in results:
+                post_id = result.get("id") or result.get("postId") or result.get("noteId")
+                if post_id is not None and post_id in seen_ids:
+                    continue  # same post surfaced by more than one keyword
+                if post_id is not None:
+                    seen_ids.add(post_id)
+                combined_results.append(result | {"search_keyword": keyword})
+        _dump_json(out_dir / f"raw_scraper_results_{combined_folder}.json", combined_results)
+        if download:
+            downloader.download_all_content(combined_results, combined_folder,
+                                            date_override=date_dir)
+    else:
+        for keyword, results in all_results.items():
+            if download and results:
+                downloader.download_all_content(results, keyword, date_override=date_dir)
+
+    total = sum(len(r) for r in all_results.values())
+    console.print(f"[bold green]Done: {total} posts across {len(keywords)} keywords[/bold green]")
+    return all_results
+
+
+def main():
+    """Main CLI interface"""
+    parser = argparse.ArgumentParser(description="Scrape multiple Xiaohongshu keywords")
+    parser.add_argument("keywords", nargs="+", help="Search keywords")
+    parser.add_argument("-m", "--max-items", type=int, default=None,
+                        help="Maximum posts per keyword")
+    parser.add_argument("-c", "--combined-folder", default=None,
+                        help="Merge all keywords into one named folder")
+    parser.add_argument("--no-download", action="store_true",
+                        help="Skip media downloads, save raw JSON only")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached actor results and re-scrape")
+    args = parser.parse_args()
+
+    max_items = args.max_items or get_config().get("default_max_items", 30)
+    scrape_multiple_keywords(args.keywords, max_items,
+                             combined_folder=args.combined_folder,
+                             download=not args.no_download,
+                             use_cache=not args.no_cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Semantic cache for aggregate LLM analysis calls
+Exact matches are keyed on a blake2b hash of the prompt plus caller-supplied
+key fields and stored in SQLite. When sentence-transformers is installed, a
+cosine-similarity lookup over cached prompts catches near-identical re-runs.
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+
+CACHE_DB = Path("data") / ".llm_cache.sqlite3"
+SIMILARITY_THRESHOLD = 0.95
+
+# Lazily created sentence-transformer; False means unavailable
+_embedder = None
+
+
+def _connect() -> sqlite3.Connection:
+    CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache("
+        "key TEXT PRIMARY KEY, fields TEXT, prompt TEXT, response BLOB, ts INT, "
+        "embedding BLOB)"
+    )
+    for migration in (
+        # Databases created before these columns existed
+        "ALTER TABLE cache ADD COLUMN fields TEXT DEFAULT ''",
+        "ALTER TABLE cache ADD COLUMN embedding BLOB",
+    ):
+        try:
+            conn.execute(migration)
+        except sqlite3.OperationalError:
+            pass
+    return conn
+
+
+def _exact_key(prompt: str, fields_key: str) -> str:
+    hasher = hashlib.blake2b(fields_key.encode("utf-8"))
+    hasher.update(b"\x00")
+    hasher.update(prompt.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _get_embedder():
+    """Load the similarity model once; returns False when unavailable"""
+    global _embedder
+    if _embedder is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+
+            _embedder = SentenceTransformer("all-MiniLM-L6-v2")
+        except ImportError:
+            _embedder = False
+    return _embedder
+
+
+def _embed_bytes(prompt: str) -> Optional[bytes]:
+    """Embed one prompt to normalized float32 bytes; None when unavailable"""
+    embedder = _get_embedder()
+    if not embedder:
+        return None
+    vec = embedder.encode([prompt], normalize_embeddings=True)[0]
+    return vec.astype("float32").tobytes()
+
+
+def _similar_lookup(conn: sqlite3.Connection, query_emb: bytes,
+                    fields_key: str) -> Optional[Any]:
+    """Cosine-similarity fallback over cached prompt embeddings.
+
+    Candidates are restricted to rows with identical key fields: prompts
+    for different analysis types share a huge corpus prefix and embed
+    nearly identically, so an unscoped scan would cross-match them.
+    Embeddings are stored at insert time, so a miss costs one encode for
+    the query rather than re-encoding every cached prompt in the bucket.
+    """
+    rows = conn.execute(
+        "SELECT embedding, response FROM cache "
+        "WHERE fields = ? AND embedding IS NOT NULL",
+        (fields_key,),
+    ).fetchall()
+    if not rows:
+        return None
+
+    import numpy as np  # installed alongside sentence-transformers
+
+    query_vec = np.frombuffer(query_emb, dtype=np.float32)
+    cached_vecs = np.vstack([np.frombuffer(r[0], dtype=np.float32) for r in rows])
+    scores = cached_vecs @ query_vec
+    best = int(scores.argmax())
+    if float(scores[best]) >= SIMILARITY_THRESHOLD:
+        return _loads(rows[best][1])
+    return None
+
+
+def cached_analyze(
+    llm,
+    prefix: str,
+    suffix: str,
+    key_fields: Iterable[str] = (),
+    use_cache: bool = True,
+) -> Any:
+    """Run a prefix/suffix-split analysis prompt through the cache.
+
+    The prefix is the stable corpus block shared across analysis types and
+    the suffix carries the type-specific instructions, so providers with
+    prompt caching can reuse the prefix. key_fields should include anything
+    else that changes the response (provider name, analysis type, model).
+    """
+    if not use_cache:
+        return llm.analyze_with_cached_prefix(prefix, suffix)
+
+    full_prompt = f"{prefix}\n\n{suffix}"
+    fields_key = "|".join(key_fields)
+    key = _exact_key(full_prompt, fields_key)
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT response FROM cache WHERE key = ?", (key,)).fetchone()
+        if row:
+            return _loads(row[0])
+
+        query_emb = _embed_bytes(full_prompt)
+        if query_emb is not None:
+            near = _similar_lookup(conn, query_emb, fields_key)
+            if near is not None:
+                return near
+
+        response = llm.analyze_with_cached_prefix(prefix, suffix)
+        conn.execute(
+            "INSERT OR REPLACE INTO cache(key, fields, prompt, response, ts, embedding) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, fields_key, full_prompt, _dumps(response), int(time.time()), query_emb),
+        )
+        conn.commit()
+        return response
+    finally:
+        conn.close()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+LLM provider wrappers for the analysis pipeline
+Each provider exposes analyze_text(text, custom_prompt=None) and returns
+parsed JSON when the model complies, or the raw string otherwise.
+"""
+
+import os
+import json
+from typing import Any, Dict, Optional
+
+# Provider SDKs (openai, google-generativeai) are imported inside the
+# provider constructors so a run only pays import cost for the SDK it uses.
+
+
+class LLMProvider:
+    """Base class for LLM providers"""
+
+    def analyze_text(self, text: str, custom_prompt: Optional[str] = None) -> Any:
+        """Run an analysis prompt against the provider and parse the response"""
+        raise NotImplementedError
+
+    def analyze_with_cached_prefix(self, prefix: str, suffix: str) -> Any:
+        """Run a prompt split into a stable prefix and a varying suffix.
+
+        Providers with prompt caching can reuse the (large, identical)
+        prefix across calls; the base implementation just concatenates.
+        """
+        return self.analyze_text("", custom_prompt=f"{prefix}\n\n{suffix}")
+
+    @staticmethod
+    def _parse_response(content: str) -> Any:
+        """Parse a model response, tolerating markdown JSON fences"""
+        cleaned = content.strip()
+        if cleaned.startswith("```"):
+            cleaned = cleaned.split("\n", 1)[-1]
+            if cleaned.endswith("```"):
+                cleaned = cleaned[:-3]
+        try:
+            return json.loads(cleaned)
+        except (json.JSONDecodeError, ValueError):
+            return content
+
+
+class OpenAIProvider(LLMProvider):
+    """OpenAI chat-completions provider (also the base for compatible APIs)"""
+
+    env_key = "OPENAI_API_KEY"
+    base_url: Optional[str] = None
+    default_model = "gpt-4o-mini"
+
+    def __init__(self, model: Optional[str] = None):
+        import openai
+
+        api_key = os.getenv(self.env_key, "")
+        if not api_key:
+            raise ValueError(f"{self.env_key} not set in environment / .env")
+        kwargs: Dict[str, Any] = {"api_key": api_key}
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        self.client = openai.OpenAI(**kwargs)
+        self.model = model or self.default_model
+
+    def analyze_text(self, text: str, custom_prompt: Optional[str] = None) -> Any:
+        prompt = custom_prompt or f"Analyze the following content:\n\n{text}"
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.3,
+        )
+        return self._parse_response(response.choices[0].message.content)
+
+    def analyze_with_cached_prefix(self, prefix: str, suffix: str) -> Any:
+        # Keeping the prefix as a byte-identical first message lets the
+        # API's automatic prefix caching skip re-processing the corpus.
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": prefix},
+                {"role": "user", "content": suffix},
+            ],
+            temperature=0.3,
+        )
+        return self._parse_response(response.choices[0].message.content)
+
+
+class DeepSeekProvider(OpenAIProvider):
+    """DeepSeek provider (OpenAI-compatible API)"""
+
+    env_key = "DEEPSEEK_API_KEY"
+    base_url = "https://api.deepseek.com"
+    default_model = "deepseek-chat"
+
+
+class MoonshotProvider(OpenAIProvider):
+    """Moonshot (Kimi) provider (OpenAI-compatible API)"""
+
+    env_key = "MOONSHOT_API_KEY"
+    base_url = "https://api.moonshot.cn/v1"
+    default_model = "moonshot-v1-8k"
+
+
+class GeminiProvider(LLMProvider):
+    """Google Gemini provider"""
+
+    def __init__(self, model: str = "gemini-1.5-flash"):
+        import google.generativeai as genai
+
+        api_key = os.getenv("GEMINI_API_KEY", "")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not set in environment / .env")
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(model)
+
+    def analyze_text(self, text: str, custom_prompt: Optional[str] = None) -> Any:
+        prompt = custom_prompt or f"Analyze the following content:\n\n{text}"
+        response = self.model.generate_content(prompt)
+        return self._parse_response(response.text)
+
+
+class LLMFactory:
+    """Factory for creating LLM providers by name"""
+
+    @staticmethod
+    def create_provider(name: str = "openai", model: Optional[str] = None) -> LLMProvider:
+        name = name.lower()
+        if name == "openai":
+            return OpenAIProvider(model=model)
+        if name == "deepseek":
+            return DeepSeekProvider(model=model)
+        if name == "moonshot":
+            return MoonshotProvider(model=model)
+        if name == "gemini":
+            return GeminiProvider(model=model or "gemini-1.5-flash")
+        raise ValueError(f"Unknown LLM provider: {name}")
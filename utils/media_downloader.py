@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Media downloader for scraped Xiaohongshu posts
+Saves each post's images/videos plus a trimmed metadata.json into
+data/downloaded_content/<date>/<keyword>/<post folder>/ — the layout
+analyze.py and analyze_multi.py read.
+"""
+
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_DIR = Path("data/downloaded_content")
+
+_SAFE_NAME_RE = re.compile(r"[^\w\- ]+")
+
+
+def _safe_name(text: str, limit: int = 40) -> str:
+    """Filesystem-safe folder fragment from a post title"""
+    cleaned = _SAFE_NAME_RE.sub("", text).strip().replace(" ", "_")
+    return cleaned[:limit] or "post"
+
+
+def _media_urls(value: Any) -> List[str]:
+    """Normalize an images/videos field (list of urls or dicts) to urls"""
+    urls: List[str] = []
+    for item in value or []:
+        if isinstance(item, str):
+            urls.append(item)
+        elif isinstance(item, dict):
+            url = item.get("url") or item.get("imageUrl") or item.get("videoUrl")
+            if url:
+                urls.append(url)
+    return urls
+
+
+class XHSMediaDownloader:
+    """Downloads post media and writes per-post metadata folders"""
+
+    def __init__(
+        self,
+        base_dir: Path = DEFAULT_BASE_DIR,
+        request_delay: float = 0.5,
+        timeout: int = 10,
+        max_retries: int = 3,
+    ):
+        self.base_dir = Path(base_dir)
+        self.request_delay = request_delay
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
+            "Referer": "https://www.xiaohongshu.com/",
+        })
+
+    def download_file(self, url: str, dest: Path) -> bool:
+        """Download one file with retries; skips files already on disk"""
+        if dest.exists():
+            return True
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                response = self.session.get(url, timeout=self.timeout, stream=True)
+                response.raise_for_status()
+                with open(dest, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+                return True
+            except requests.RequestException as exc:
+                logger.warning("Download failed (%d/%d): %s (%s)",
+                               attempt, self.max_retries, url, exc)
+                time.sleep(self.request_delay)
+        return False
+
+    @staticmethod
+    def extract_metadata(post: Dict[str, Any]) -> Dict[str, Any]:
+        """Trim an Apify post record to the fields the pipeline uses"""
+        author = post.get("author") or post.get("user") or {}
+        interact = post.get("interactInfo") or {}
+        return {
+            "post_id": post.get("id") or post.get("postId") or post.get("noteId") or "unknown",
+            "url": post.get("url") or post.get("noteUrl", ""),
+            "search_keyword": post.get("search_keyword", ""),
+            "text_content": {
+                "title": post.get("title", ""),
+                "description": post.get("desc") or post.get("description", ""),
+            },
+            "author": {
+                "name": author.get("name") or author.get("nickname", "Unknown"),
+            },
+            "engagement": {
+                "likes": post.get("likes") or interact.get("likedCount", 0),
+                "comments": post.get("comments") or interact.get("commentCount", 0),
+                "shares": post.get("shares") or interact.get("shareCount", 0),
+            },
+        }
+
+    def process_scraper_results(
+        self,
+        results: List[Dict[str, Any]],
+        keyword_dir: Path,
+    ) -> List[Dict[str, Any]]:
+        """Save metadata and download media for every post into keyword_dir
+
+        Downloads are I/O-bound, so all media files across every post are
+        fetched through one thread pool instead of one-at-a-time with a
+        sleep between each; failures are tracked per file as before.
+        """
+        keyword_dir.mkdir(parents=True, exist_ok=True)
+        download_results: List[Dict[str, Any]] = []
+        tasks: List[tuple] = []  # (url, dest, downloaded-names list)
+        for post in results:
+            metadata = self.extract_metadata(post)
+            post_id = metadata["post_id"]
+            folder = keyword_dir / f"{post_id}_{_safe_name(metadata['text_content']['title'])}"
+            folder.mkdir(parents=True, exist_ok=True)
+
+            metadata_path = folder / "metadata.json"
+            if orjson is not None:
+                metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            else:
+                metadata_path.write_text(
+                    json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8"
+                )
+
+            images_downloaded: List[str] = []
+            videos_downloaded: List[str] = []
+            for i, url in enumerate(_media_urls(post.get("images"))):
+                tasks.append((url, folder / f"image_{i:02d}.jpg", images_downloaded))
+            for i, url in enumerate(_media_urls(post.get("videos"))):
+                tasks.append((url, folder / f"video_{i:02d}.mp4", videos_downloaded))
+
+            download_results.append({
+                "post_id": post_id,
+                "folder": str(folder),
+                "images_downloaded": images_downloaded,
+                "videos_downloaded": videos_downloaded,
+                "metadata": metadata,
+            })
+
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(32, len(tasks))) as pool:
+                for (url, dest, downloaded), ok in zip(
+                    tasks, pool.map(lambda t: self.download_file(t[0], t[1]), tasks)
+                ):
+                    if ok:
+                        downloaded.append(dest.name)
+        return download_results
+
+    def download_all_content(
+        self,
+        results: List[Dict[str, Any]],
+        keyword: str,
+        date_override: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Download everything for one keyword into the dated layout"""
+        date_dir = date_override or datetime.now().strftime("%Y%m%d")
+        keyword_dir = self.base_dir / date_dir / _safe_name(keyword)
+        return self.process_scraper_results(results, keyword_dir)